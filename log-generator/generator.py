@@ -12,83 +12,172 @@ Sends events to Splunk via HTTP Event Collector (HEC).
 """
 
 import os
-import random
+import queue
 import signal
+import threading
 import time
+from dataclasses import dataclass
 
-from splunk_events import GENERATORS, HECClient
+from splunk_events import HECClient, generate_events
+
+
+@dataclass(frozen=True)
+class Config:
+    """Generator settings."""
+
+    events_per_minute: int
+    anomaly_rate: float
+    hec_batch_window_s: float
+    hec_max_batch: int
+
+
+def load_config() -> Config:
+    """Read generator settings from the environment."""
+    return Config(
+        events_per_minute=int(os.environ.get("EVENTS_PER_MINUTE", "60")),
+        anomaly_rate=float(os.environ.get("ANOMALY_RATE", "0.05")),
+        hec_batch_window_s=float(os.environ.get("HEC_BATCH_WINDOW_S", "1.0")),
+        hec_max_batch=int(os.environ.get("HEC_MAX_BATCH", "500")),
+    )
 
-# Configuration from environment
-EVENTS_PER_MINUTE = int(os.environ.get("EVENTS_PER_MINUTE", "60"))
-ANOMALY_RATE = float(os.environ.get("ANOMALY_RATE", "0.05"))
 
 # Initialize HEC client
 hec = HECClient(default_host="log-generator")
 
-# Global flag for graceful shutdown
-running = True
+# Batches waiting to be posted by the sender thread (None signals shutdown)
+send_queue: queue.Queue = queue.Queue(maxsize=32)
+
+# Set on shutdown; waiting on it doubles as an interruptible sleep
+stop_event = threading.Event()
+
+# Seconds to let the sender drain queued batches on shutdown before exiting;
+# the sender is a daemon thread, so anything still queued is dropped
+SHUTDOWN_TIMEOUT_S = 5.0
+
+# Counters updated by the sender thread
+event_count = 0
+error_count = 0
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
-    global running
     print("\nShutting down log generator...")
-    running = False
+    stop_event.set()
 
 
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 
+def sender():
+    """Post queued batches to HEC until a None sentinel is received."""
+    global event_count, error_count
+    start_time = time.time()
+
+    while True:
+        events = send_queue.get()
+        if events is None:
+            break
+
+        before = event_count
+        if not hec.send(events):
+            error_count += 1
+            continue
+        event_count += len(events)
+
+        # Progress output every 100 events
+        if event_count // 100 > before // 100:
+            elapsed = time.time() - start_time
+            rate = event_count / elapsed if elapsed > 0 else 0
+            print(f"Events: {event_count:,} | Rate: {rate:.1f}/s | Errors: {error_count}")
+
+
+def enqueue(events: list) -> bool:
+    """Queue a batch for the sender, giving up if shutdown starts while the queue is full."""
+    while not stop_event.is_set():
+        try:
+            send_queue.put(events, timeout=0.5)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def should_flush(pending: int, since_flush: float, config: Config) -> bool:
+    """Return True once the batch is full or its window has elapsed."""
+    return pending >= config.hec_max_batch or since_flush >= config.hec_batch_window_s
+
+
+def schedule_next_tick(next_tick: float, interval: float, now: float) -> tuple[float, float]:
+    """Advance the tick schedule, returning the new tick time and how long to sleep.
+
+    Ticks stay on a fixed grid so time spent generating does not drift the
+    rate. If the loop has fallen behind, the grid restarts from now instead
+    of bursting to catch up.
+    """
+    next_tick += interval
+    delay = next_tick - now
+    if delay <= 0:
+        return now, 0.0
+    return next_tick, delay
+
+
 def main():
     """Main event generation loop."""
+    config = load_config()
+
     print("Starting log generator...")
     print(f"  HEC URL: {hec.url}")
-    print(f"  Events/min: {EVENTS_PER_MINUTE}")
-    print(f"  Anomaly rate: {ANOMALY_RATE * 100}%")
+    print(f"  Events/min: {config.events_per_minute}")
+    print(f"  Anomaly rate: {config.anomaly_rate * 100}%")
 
     # Wait for Splunk to be ready
     if not hec.wait_until_ready(max_retries=60, retry_interval=5):
         print("Warning: Could not verify HEC availability, proceeding anyway...")
 
     # Calculate sleep interval
-    events_per_second = EVENTS_PER_MINUTE / 60
+    events_per_second = config.events_per_minute / 60
     batch_size = max(1, int(events_per_second))
     sleep_interval = batch_size / events_per_second
 
-    event_count = 0
-    error_count = 0
-    start_time = time.time()
-
     print(f"Generating {batch_size} events every {sleep_interval:.2f}s")
+    print(f"Flushing to HEC every {config.hec_batch_window_s:.1f}s or {config.hec_max_batch} events")
     print("-" * 50)
 
-    while running:
-        # Generate batch of events
-        events = []
-        for _ in range(batch_size):
-            # Select generator based on weights
-            r = random.random()
-            cumulative = 0
-            for generator, weight in GENERATORS:
-                cumulative += weight
-                if r < cumulative:
-                    events.append(generator(anomaly_rate=ANOMALY_RATE))
-                    break
-
-        # Send to HEC
-        if hec.send(events):
-            event_count += len(events)
-        else:
-            error_count += 1
+    # Send from a background thread so generation continues during HEC round-trips
+    sender_thread = threading.Thread(target=sender, name="hec-sender", daemon=True)
+    sender_thread.start()
 
-        # Progress output every 100 events
-        if event_count % 100 < batch_size:
-            elapsed = time.time() - start_time
-            rate = event_count / elapsed if elapsed > 0 else 0
-            print(f"Events: {event_count:,} | Rate: {rate:.1f}/s | Errors: {error_count}")
+    pending = []
+    last_flush = time.monotonic()
+    next_tick = last_flush
 
-        time.sleep(sleep_interval)
+    while not stop_event.is_set():
+        # Generate batch of events
+        pending.extend(generate_events(batch_size, anomaly_rate=config.anomaly_rate))
+
+        # Hand accumulated events to the sender as one HEC request
+        if should_flush(len(pending), time.monotonic() - last_flush, config):
+            if enqueue(pending):
+                pending = []
+                last_flush = time.monotonic()
+
+        # Sleep until the next tick, compensating for time spent generating/sending
+        next_tick, delay = schedule_next_tick(next_tick, sleep_interval, time.monotonic())
+        if delay > 0:
+            stop_event.wait(delay)
+
+    # Flush anything still pending if there is room, then give the sender a
+    # bounded time to drain so a slow or unreachable HEC cannot block exit
+    try:
+        if pending:
+            send_queue.put_nowait(pending)
+        send_queue.put_nowait(None)
+    except queue.Full:
+        pass
+    sender_thread.join(SHUTDOWN_TIMEOUT_S)
+    if sender_thread.is_alive():
+        print(f"HEC sender still busy after {SHUTDOWN_TIMEOUT_S:.0f}s; dropping {send_queue.qsize()} queued batches")
 
     print(f"\nShutdown complete. Total events: {event_count:,}")
 
@@ -1,11 +1,15 @@
 """Tests for log-generator/generator.py."""
 
 import os
+import queue
 import signal
-from unittest.mock import patch, MagicMock
+import threading
+from unittest.mock import patch
 
 import pytest
 
+import generator
+
 
 class TestConfiguration:
     """Tests for configuration parsing."""
@@ -13,57 +17,58 @@ class TestConfiguration:
     def test_default_events_per_minute(self):
         """Should default to 60 events per minute."""
         with patch.dict(os.environ, {}, clear=True):
-            # Re-import to get fresh config
-            import importlib
-            import generator
-            importlib.reload(generator)
-            assert generator.EVENTS_PER_MINUTE == 60
+            assert generator.load_config().events_per_minute == 60
 
     def test_custom_events_per_minute(self):
         """Should use custom events per minute from env."""
         with patch.dict(os.environ, {"EVENTS_PER_MINUTE": "120"}):
-            import importlib
-            import generator
-            importlib.reload(generator)
-            assert generator.EVENTS_PER_MINUTE == 120
+            assert generator.load_config().events_per_minute == 120
 
     def test_default_anomaly_rate(self):
         """Should default to 0.05 anomaly rate."""
         with patch.dict(os.environ, {}, clear=True):
-            import importlib
-            import generator
-            importlib.reload(generator)
-            assert generator.ANOMALY_RATE == 0.05
+            assert generator.load_config().anomaly_rate == 0.05
 
     def test_custom_anomaly_rate(self):
         """Should use custom anomaly rate from env."""
         with patch.dict(os.environ, {"ANOMALY_RATE": "0.10"}):
-            import importlib
-            import generator
-            importlib.reload(generator)
-            assert generator.ANOMALY_RATE == 0.10
+            assert generator.load_config().anomaly_rate == 0.10
+
+    def test_default_batch_window(self):
+        """Should default to a 1 second HEC batch window and 500 event cap."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = generator.load_config()
+            assert config.hec_batch_window_s == 1.0
+            assert config.hec_max_batch == 500
+
+    def test_custom_batch_window(self):
+        """Should use custom HEC batch window and cap from env."""
+        with patch.dict(os.environ, {"HEC_BATCH_WINDOW_S": "5", "HEC_MAX_BATCH": "1000"}):
+            config = generator.load_config()
+            assert config.hec_batch_window_s == 5.0
+            assert config.hec_max_batch == 1000
 
 
 class TestSignalHandler:
     """Tests for signal handler."""
 
-    def test_signal_handler_sets_running_false(self):
-        """Signal handler should set running to False."""
+    def test_signal_handler_sets_stop_event(self):
+        """Signal handler should set the stop event."""
         import generator
-        generator.running = True
+        generator.stop_event.clear()
 
         generator.signal_handler(signal.SIGINT, None)
 
-        assert generator.running is False
+        assert generator.stop_event.is_set()
 
     def test_signal_handler_handles_sigterm(self):
         """Signal handler should handle SIGTERM."""
         import generator
-        generator.running = True
+        generator.stop_event.clear()
 
         generator.signal_handler(signal.SIGTERM, None)
 
-        assert generator.running is False
+        assert generator.stop_event.is_set()
 
 
 class TestRateCalculations:
@@ -106,31 +111,67 @@ class TestRateCalculations:
         assert sleep_interval == 1.0
 
 
+class TestFlushPolicy:
+    """Tests for the HEC batch flush decision."""
+
+    config = generator.Config(events_per_minute=60, anomaly_rate=0.05,
+                              hec_batch_window_s=1.0, hec_max_batch=500)
+
+    def test_flushes_when_batch_full(self):
+        """Should flush once the batch cap is reached, even inside the window."""
+        assert generator.should_flush(500, 0.1, self.config)
+
+    def test_flushes_when_window_elapsed(self):
+        """Should flush a partial batch once the window has elapsed."""
+        assert generator.should_flush(3, 1.0, self.config)
+
+    def test_holds_partial_batch_inside_window(self):
+        """Should keep accumulating while under the cap and inside the window."""
+        assert not generator.should_flush(499, 0.99, self.config)
+
+
+class TestTickSchedule:
+    """Tests for the fixed-rate tick schedule."""
+
+    def test_sleeps_until_next_tick(self):
+        """Should sleep only for what is left of the interval."""
+        next_tick, delay = generator.schedule_next_tick(100.0, 1.0, 100.3)
+        assert next_tick == 101.0
+        assert delay == pytest.approx(0.7)
+
+    def test_stays_on_grid_across_ticks(self):
+        """Generation time should not accumulate as drift."""
+        next_tick = 100.0
+        for now in (100.4, 101.2, 102.9):
+            next_tick, _ = generator.schedule_next_tick(next_tick, 1.0, now)
+        assert next_tick == 103.0
+
+    def test_restarts_from_now_when_behind(self):
+        """Should not sleep or burst when a tick overran the interval."""
+        next_tick, delay = generator.schedule_next_tick(100.0, 1.0, 102.5)
+        assert next_tick == 102.5
+        assert delay == 0.0
+
+
 class TestMainLoop:
     """Tests for main loop behavior."""
 
+    @patch('generator.generate_events')
     @patch('generator.hec')
-    @patch('generator.GENERATORS')
-    def test_generates_events_in_batches(self, mock_generators, mock_hec):
-        """Should generate events in batches."""
+    def test_main_sends_generated_events_on_shutdown(self, mock_hec, mock_generate_events):
+        """Events pending when stop is requested should be flushed to HEC."""
         import generator
-
-        # Setup mock generator
-        mock_gen = MagicMock(return_value={"event": "test"})
-        mock_generators.__iter__ = MagicMock(return_value=iter([(mock_gen, 1.0)]))
-
-        mock_hec.send.return_value = True
+        generator.stop_event.clear()
         mock_hec.wait_until_ready.return_value = True
+        mock_hec.send.return_value = True
+        # Stop after the first tick; the batch is below the cap and window
+        mock_generate_events.side_effect = lambda n, **kwargs: generator.stop_event.set() or [{"event": "test"}] * n
 
-        # Run one iteration
-        generator.running = True
-        events = []
-        batch_size = 5
-
-        for _ in range(batch_size):
-            events.append(mock_gen())
+        with patch.dict(os.environ, {"EVENTS_PER_MINUTE": "300", "HEC_BATCH_WINDOW_S": "60"}):
+            generator.main()
 
-        assert len(events) == batch_size
+        mock_generate_events.assert_called_once_with(5, anomaly_rate=0.05)
+        mock_hec.send.assert_called_once_with([{"event": "test"}] * 5)
 
     @patch('generator.hec')
     def test_counts_errors_on_send_failure(self, mock_hec):
@@ -157,3 +198,73 @@ class TestMainLoop:
             event_count += len(events)
 
         assert event_count == 2
+
+
+class TestSender:
+    """Tests for the background HEC sender."""
+
+    @patch('generator.hec')
+    def test_sender_drains_queue_until_sentinel(self, mock_hec):
+        """Sender should post each queued batch and stop on None."""
+        import generator
+        mock_hec.send.side_effect = [True, False]
+        generator.event_count = 0
+        generator.error_count = 0
+
+        generator.send_queue.put([{"event": "a"}, {"event": "b"}])
+        generator.send_queue.put([{"event": "c"}])
+        generator.send_queue.put(None)
+        generator.sender()
+
+        assert mock_hec.send.call_count == 2
+        assert generator.event_count == 2
+        assert generator.error_count == 1
+
+    @patch('generator.hec')
+    def test_sender_skips_progress_on_failed_send(self, mock_hec, capsys):
+        """A failed batch should not print progress even at a 100-event boundary."""
+        import generator
+        mock_hec.send.return_value = False
+        generator.event_count = 100
+        generator.error_count = 0
+
+        generator.send_queue.put([{"event": "a"}])
+        generator.send_queue.put(None)
+        generator.sender()
+
+        assert capsys.readouterr().out == ""
+        assert generator.event_count == 100
+
+    def test_enqueue_gives_up_on_shutdown_when_full(self):
+        """enqueue should return False instead of blocking once stop is requested."""
+        import generator
+        generator.stop_event.set()
+        full = queue.Queue(maxsize=1)
+        full.put([{"event": "x"}])
+
+        with patch('generator.send_queue', full):
+            assert generator.enqueue([{"event": "y"}]) is False
+
+        assert full.qsize() == 1
+
+    @patch('generator.generate_events', return_value=[{"event": "test"}])
+    @patch('generator.hec')
+    def test_shutdown_does_not_wait_for_stuck_sender(self, mock_hec, mock_generate_events):
+        """main should exit after SHUTDOWN_TIMEOUT_S even if a send never returns."""
+        import generator
+        release = threading.Event()
+        mock_hec.send.side_effect = lambda events: release.wait()
+        mock_generate_events.side_effect = lambda n, **kwargs: generator.stop_event.set() or [{"event": "test"}]
+        generator.stop_event.clear()
+
+        with patch('generator.SHUTDOWN_TIMEOUT_S', 0.1), patch.dict(os.environ, {"HEC_MAX_BATCH": "1"}):
+            generator.main()
+
+        senders = [t for t in threading.enumerate() if t.name == "hec-sender"]
+        assert any(t.is_alive() for t in senders)
+
+        # Release the abandoned sender; it then reads the sentinel and exits
+        release.set()
+        for thread in senders:
+            thread.join(timeout=5)
+        assert generator.send_queue.empty()
@@ -8,45 +8,194 @@ Creates 7 days of realistic log data across all indexes.
 This runs once at startup to populate initial data, then exits.
 """
 
+import itertools
+import math
 import os
 import random
 import sys
 import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from multiprocessing import Pool
 
-from splunk_events import generate_event, HECClient
+import numpy as np
+from splunk_events import generate_batch, HECClient
+
+
+@dataclass(frozen=True)
+class Config:
+    """Seeder settings."""
+
+    days_to_seed: int
+    events_per_day: int
+    batch_size: int
+    send_workers: int
+    seed_processes: int
+    random_seed: int | None = None
+
+
+def load_config() -> Config:
+    """Read seeder settings from the environment."""
+    days_to_seed = int(os.environ.get("DAYS_TO_SEED", "7"))
+    # Days are the unit of parallel work, so extra processes would sit idle
+    default_processes = min(os.cpu_count() or 1, days_to_seed)
+    return Config(
+        days_to_seed=days_to_seed,
+        events_per_day=int(os.environ.get("EVENTS_PER_DAY", "50000")),
+        batch_size=int(os.environ.get("BATCH_SIZE", "5000")),
+        send_workers=int(os.environ.get("SEND_WORKERS", "8")),
+        seed_processes=int(os.environ.get("SEED_PROCESSES", str(default_processes))),
+        random_seed=int(os.environ["SEED"]) if os.environ.get("SEED") else None,
+    )
 
-# Configuration from environment
-DAYS_TO_SEED = int(os.environ.get("DAYS_TO_SEED", "7"))
-EVENTS_PER_DAY = int(os.environ.get("EVENTS_PER_DAY", "50000"))
-BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "500"))
 
 # Initialize HEC client
 hec = HECClient(default_host="seed-data", timeout=30)
 
+# Default generator for vectorized draws outside the per-day workers
+_rng = np.random.Generator(np.random.PCG64DXSM())
+
+
+def _hour_pmf(mean: float = 14.0, stddev: float = 4.0) -> np.ndarray:
+    """Probability of each hour when a normal draw is truncated and clipped to 0-23."""
+    def cdf(x: float) -> float:
+        return 0.5 * (1 + math.erf((x - mean) / (stddev * math.sqrt(2))))
+
+    # Hour 0 absorbs everything below 1, hour 23 everything from 23 up
+    edges = [0.0] + [cdf(h) for h in range(1, 24)] + [1.0]
+    return np.diff(edges)
+
+
+# Share of a day's events falling in each hour
+_HOUR_PMF = _hour_pmf()
+
+# Anomaly probability inside and outside an anomaly window
+ANOMALY_RATE_IN_WINDOW = 0.30
+ANOMALY_RATE_BASELINE = 0.03
+
+
+def generate_day_timestamps(day_start: int, n: int, rng: np.random.Generator | None = None) -> np.ndarray:
+    """Return n sorted epoch-second timestamps within the day starting at day_start.
+
+    Hours follow a normal distribution centred on 14:00 (clipped to the day);
+    minutes and seconds are uniform. Events are split across hours with one
+    multinomial draw and each hour is sorted on its own, so the result comes
+    out ordered without sorting the whole day.
+    """
+    rng = rng or _rng
+    counts = rng.multinomial(n, _HOUR_PMF)
+    hour_starts = np.repeat(np.arange(0, 86400, 3600), counts)
+    offsets = np.concatenate([np.sort(rng.integers(0, 3600, count)) for count in counts])
+    return day_start + hour_starts + offsets
+
+
+def anomaly_rates(timestamps: np.ndarray, anomaly_windows: list[tuple[float, float]]) -> np.ndarray:
+    """Return the anomaly rate for each timestamp.
+
+    Windows are inclusive at both ends and must not overlap. Each timestamp
+    is matched to the last window starting at or before it with a binary
+    search, so the cost is O(N log W) instead of scanning every window.
+    """
+    if not anomaly_windows:
+        return np.full(len(timestamps), ANOMALY_RATE_BASELINE)
+
+    windows = sorted(anomaly_windows)
+    starts = np.array([ws for ws, _ in windows])
+    ends = np.array([we for _, we in windows])
+
+    i = np.searchsorted(starts, timestamps, side="right") - 1
+    in_anomaly = (i >= 0) & (timestamps <= ends[np.maximum(i, 0)])
+    return np.where(in_anomaly, ANOMALY_RATE_IN_WINDOW, ANOMALY_RATE_BASELINE)
 
-def seed_historical_data():
+
+def generate_day_payloads(
+    day_start: int,
+    seed: np.random.SeedSequence,
+    events_per_day: int,
+    batch_size: int,
+    anomaly_windows: list[tuple[float, float]]
+) -> list[tuple[int, bytearray]]:
+    """Generate one day of events as serialized HEC payloads.
+
+    Runs in a worker process. Each day gets its own child SeedSequence,
+    so workers draw from independent, non-overlapping streams. Returns
+    (event_count, payload) pairs, one per batch.
+    """
+    random.seed(int.from_bytes(seed.generate_state(4).tobytes(), "little"))
+    rng = np.random.Generator(np.random.PCG64DXSM(seed))
+
+    timestamps = generate_day_timestamps(day_start, events_per_day, rng)
+    rates = anomaly_rates(timestamps, anomaly_windows).tolist()
+    timestamps = timestamps.tolist()
+
+    payloads = []
+    for i in range(0, events_per_day, batch_size):
+        batch = generate_batch(timestamps[i:i + batch_size], rates[i:i + batch_size])
+        payloads.append((len(batch), hec.build_payload(batch)))
+    return payloads
+
+
+def iter_day_payloads(pool: Pool, tasks: Iterable[tuple], window: int) -> Iterator[list[tuple[int, bytearray]]]:
+    """Yield generate_day_payloads results in day order from a process pool.
+
+    At most window days are submitted or waiting to be collected at once,
+    so finished days cannot pile up in the parent while sends lag behind.
+    The next day is submitted before each result is handed back, keeping
+    the workers busy while the caller sends.
+    """
+    tasks = iter(tasks)
+    pending = deque(pool.apply_async(generate_day_payloads, task) for task in itertools.islice(tasks, window))
+    while pending:
+        payloads = pending.popleft().get()
+        task = next(tasks, None)
+        if task is not None:
+            pending.append(pool.apply_async(generate_day_payloads, task))
+        yield payloads
+
+
+def send_batch(payload: bytearray, count: int) -> int:
+    """Send one serialized batch to HEC, returning the number of events accepted."""
+    return count if hec.send_payload(payload) else 0
+
+
+def seed_historical_data(config: Config | None = None):
     """Seed historical data into Splunk."""
+    config = config or load_config()
+    # More senders than pooled connections would discard keep-alive connections
+    send_workers = min(config.send_workers, hec.max_connections)
+
     print("=" * 60)
     print("Splunk Demo Data Seeder")
     print("=" * 60)
     print(f"  HEC URL: {hec.url}")
-    print(f"  Days to seed: {DAYS_TO_SEED}")
-    print(f"  Events per day: {EVENTS_PER_DAY:,}")
-    print(f"  Total events: {DAYS_TO_SEED * EVENTS_PER_DAY:,}")
-    print(f"  Batch size: {BATCH_SIZE}")
+    print(f"  Days to seed: {config.days_to_seed}")
+    print(f"  Events per day: {config.events_per_day:,}")
+    print(f"  Total events: {config.days_to_seed * config.events_per_day:,}")
+    print(f"  Batch size: {config.batch_size}")
+    print(f"  Send workers: {send_workers}")
+    print(f"  Generator processes: {config.seed_processes}")
     print("=" * 60)
 
     if not hec.wait_until_ready(max_retries=120, retry_interval=5):
         sys.exit(1)
 
+    # SEED makes timestamps, anomaly windows and event field values
+    # reproducible (IDs from secrets stay unique); otherwise fresh OS
+    # entropy is used
+    if config.random_seed is not None:
+        random.seed(config.random_seed)
+    day_seeds = np.random.SeedSequence(config.random_seed).spawn(config.days_to_seed)
+
     # Calculate time range
     now = datetime.now()
-    start_time = now - timedelta(days=DAYS_TO_SEED)
+    start_time = now - timedelta(days=config.days_to_seed)
 
     # Define anomaly windows (simulate past incidents)
     anomaly_windows = []
-    for day in range(1, DAYS_TO_SEED):
+    for day in range(1, config.days_to_seed):
         if random.random() < 0.3:
             window_start = start_time + timedelta(days=day, hours=random.randint(8, 18))
             window_end = window_start + timedelta(hours=random.randint(1, 3))
@@ -57,56 +206,61 @@ def seed_historical_data():
     error_count = 0
     start = time.time()
 
-    for day in range(DAYS_TO_SEED):
+    # Days are independent, so they are generated and serialized in worker
+    # processes and handed back in day order
+    tasks = []
+    for day in range(config.days_to_seed):
         day_start = start_time + timedelta(days=day)
+        # Integer epoch seconds: HEC accepts them and the column stays int64
+        day_base = int(day_start.replace(hour=0, minute=0, second=0).timestamp())
+        tasks.append((day_base, day_seeds[day], config.events_per_day, config.batch_size, anomaly_windows))
+
+    # Start worker processes before any sender threads exist
+    processes = min(config.seed_processes, config.days_to_seed)
+    pool = Pool(processes) if processes > 1 else None
+    if pool:
+        days = iter_day_payloads(pool, tasks, processes)
+    else:
+        days = (generate_day_payloads(*task) for task in tasks)
+
+    # Batches are posted from a thread pool while generation continues;
+    # capping in-flight batches bounds memory if HEC falls behind
+    executor = ThreadPoolExecutor(max_workers=send_workers, thread_name_prefix="hec-sender")
+    in_flight: deque[Future] = deque()
+    max_in_flight = send_workers * 2
 
-        print(f"\nSeeding day {day + 1}/{DAYS_TO_SEED}: {day_start.strftime('%Y-%m-%d')}")
-
-        # Generate timestamps for this day (distributed throughout the day)
-        timestamps = []
-        for _ in range(EVENTS_PER_DAY):
-            hour = random.gauss(14, 4)
-            hour = max(0, min(23, int(hour)))
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            ts = day_start.replace(hour=hour, minute=minute, second=second)
-            timestamps.append(ts.timestamp())
-
-        timestamps.sort()
-
-        # Generate and send events in batches
-        batch = []
-        day_events = 0
-
-        for ts in timestamps:
-            # Check if timestamp is in anomaly window
-            in_anomaly = any(ws <= ts <= we for ws, we in anomaly_windows)
-            anomaly_rate = 0.30 if in_anomaly else 0.03
-
-            event = generate_event(timestamp=ts, anomaly_rate=anomaly_rate)
-            batch.append(event)
-
-            if len(batch) >= BATCH_SIZE:
-                if hec.send(batch):
-                    total_events += len(batch)
-                    day_events += len(batch)
-                else:
-                    error_count += 1
-
-                batch = []
-
-                if day_events % 10000 == 0:
-                    elapsed = time.time() - start
-                    rate = total_events / elapsed if elapsed > 0 else 0
-                    print(f"  Progress: {day_events:,}/{EVENTS_PER_DAY:,} | Total: {total_events:,} | Rate: {rate:.0f}/s")
-
-        # Send remaining batch
-        if batch:
-            if hec.send(batch):
-                total_events += len(batch)
+    def collect(limit: int):
+        nonlocal total_events, error_count
+        while len(in_flight) > limit:
+            sent = in_flight.popleft().result()
+            if sent:
+                total_events += sent
             else:
                 error_count += 1
 
+    try:
+        for day, payloads in enumerate(days):
+            day_start = start_time + timedelta(days=day)
+            print(f"\nSeeding day {day + 1}/{config.days_to_seed}: {day_start.strftime('%Y-%m-%d')}")
+
+            for count, payload in payloads:
+                collect(max_in_flight - 1)
+                in_flight.append(executor.submit(send_batch, payload, count))
+
+            elapsed = time.time() - start
+            rate = total_events / elapsed if elapsed > 0 else 0
+            print(f"  Queued: {config.events_per_day:,} | Total sent: {total_events:,} | Rate: {rate:.0f}/s")
+
+        # Wait for outstanding sends
+        collect(0)
+    finally:
+        # Every day has been collected on success, so terminating only
+        # matters when sending failed part way through
+        if pool:
+            pool.terminate()
+            pool.join()
+        executor.shutdown(cancel_futures=True)
+
     # Final summary
     elapsed = time.time() - start
     print("\n" + "=" * 60)
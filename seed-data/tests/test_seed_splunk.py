@@ -5,8 +5,11 @@ import random
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
+import numpy as np
 import pytest
 
+import seed_splunk
+
 
 class TestConfiguration:
     """Tests for configuration parsing."""
@@ -14,50 +17,62 @@ class TestConfiguration:
     def test_default_days_to_seed(self):
         """Should default to 7 days."""
         with patch.dict(os.environ, {}, clear=True):
-            import importlib
-            import seed_splunk
-            importlib.reload(seed_splunk)
-            assert seed_splunk.DAYS_TO_SEED == 7
+            assert seed_splunk.load_config().days_to_seed == 7
 
     def test_custom_days_to_seed(self):
         """Should use custom days from env."""
         with patch.dict(os.environ, {"DAYS_TO_SEED": "14"}):
-            import importlib
-            import seed_splunk
-            importlib.reload(seed_splunk)
-            assert seed_splunk.DAYS_TO_SEED == 14
+            assert seed_splunk.load_config().days_to_seed == 14
 
     def test_default_events_per_day(self):
         """Should default to 50000 events per day."""
         with patch.dict(os.environ, {}, clear=True):
-            import importlib
-            import seed_splunk
-            importlib.reload(seed_splunk)
-            assert seed_splunk.EVENTS_PER_DAY == 50000
+            assert seed_splunk.load_config().events_per_day == 50000
 
     def test_custom_events_per_day(self):
         """Should use custom events per day from env."""
         with patch.dict(os.environ, {"EVENTS_PER_DAY": "10000"}):
-            import importlib
-            import seed_splunk
-            importlib.reload(seed_splunk)
-            assert seed_splunk.EVENTS_PER_DAY == 10000
+            assert seed_splunk.load_config().events_per_day == 10000
 
     def test_default_batch_size(self):
-        """Should default to 500 batch size."""
+        """Should default to 5000 batch size."""
         with patch.dict(os.environ, {}, clear=True):
-            import importlib
-            import seed_splunk
-            importlib.reload(seed_splunk)
-            assert seed_splunk.BATCH_SIZE == 500
+            assert seed_splunk.load_config().batch_size == 5000
 
     def test_custom_batch_size(self):
         """Should use custom batch size from env."""
         with patch.dict(os.environ, {"BATCH_SIZE": "1000"}):
-            import importlib
-            import seed_splunk
-            importlib.reload(seed_splunk)
-            assert seed_splunk.BATCH_SIZE == 1000
+            assert seed_splunk.load_config().batch_size == 1000
+
+    def test_default_send_workers(self):
+        """Should default to 8 concurrent send workers."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert seed_splunk.load_config().send_workers == 8
+
+    def test_custom_send_workers(self):
+        """Should use custom send worker count from env."""
+        with patch.dict(os.environ, {"SEND_WORKERS": "2"}):
+            assert seed_splunk.load_config().send_workers == 2
+
+    def test_custom_seed_processes(self):
+        """Should use custom generator process count from env."""
+        with patch.dict(os.environ, {"SEED_PROCESSES": "3"}):
+            assert seed_splunk.load_config().seed_processes == 3
+
+    def test_default_seed_processes_capped_at_days(self):
+        """Should not default to more generator processes than days."""
+        with patch.dict(os.environ, {"DAYS_TO_SEED": "2"}), patch('seed_splunk.os.cpu_count', return_value=64):
+            assert seed_splunk.load_config().seed_processes == 2
+
+    def test_default_random_seed_is_none(self):
+        """Should draw fresh entropy unless SEED is set."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert seed_splunk.load_config().random_seed is None
+
+    def test_custom_random_seed(self):
+        """Should use SEED from env for reproducible runs."""
+        with patch.dict(os.environ, {"SEED": "42"}):
+            assert seed_splunk.load_config().random_seed == 42
 
 
 class TestTimestampGeneration:
@@ -65,53 +80,53 @@ class TestTimestampGeneration:
 
     def test_timestamps_are_sorted(self):
         """Generated timestamps should be sorted."""
-        random.seed(42)  # For reproducibility
-        day_start = datetime.now().replace(hour=0, minute=0, second=0)
+        timestamps = seed_splunk.generate_day_timestamps(1_700_000_000, 1000)
+        assert np.all(np.diff(timestamps) >= 0)
+
+    def test_timestamps_within_day(self):
+        """Timestamps should be within the day."""
+        day_start = int(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
+        timestamps = seed_splunk.generate_day_timestamps(day_start, 1000)
 
-        timestamps = []
-        for _ in range(100):
-            hour = random.gauss(14, 4)
-            hour = max(0, min(23, int(hour)))
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            ts = day_start.replace(hour=hour, minute=minute, second=second)
-            timestamps.append(ts.timestamp())
+        assert timestamps.min() >= day_start
+        assert timestamps.max() < day_start + 86400
 
-        timestamps.sort()
+    def test_hour_pmf_matches_clipped_normal(self):
+        """Hour buckets should match truncating and clipping normal(14, 4) draws."""
+        pmf = seed_splunk._HOUR_PMF
+        assert len(pmf) == 24
+        assert abs(pmf.sum() - 1.0) < 1e-12
 
-        # Verify sorted
-        for i in range(len(timestamps) - 1):
-            assert timestamps[i] <= timestamps[i + 1]
+        rng = np.random.default_rng(0)
+        hours = np.clip(rng.normal(14, 4, 200_000).astype(np.int64), 0, 23)
+        empirical = np.bincount(hours, minlength=24) / len(hours)
+        assert np.allclose(pmf, empirical, atol=0.005)
 
-    def test_timestamps_within_day(self):
-        """Timestamps should be within the day."""
-        random.seed(42)
-        day_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
+    def test_spawned_streams_are_independent_and_reproducible(self):
+        """Child seeds should differ from each other but replay identically."""
+        def draw(seed):
+            rng = np.random.Generator(np.random.PCG64DXSM(seed))
+            return seed_splunk.generate_day_timestamps(0, 100, rng)
+
+        first, second = np.random.SeedSequence(42).spawn(2)
+        replay, _ = np.random.SeedSequence(42).spawn(2)
 
-        for _ in range(100):
-            hour = random.gauss(14, 4)
-            hour = max(0, min(23, int(hour)))
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            ts = day_start.replace(hour=hour, minute=minute, second=second)
+        assert not np.array_equal(draw(first), draw(second))
+        assert np.array_equal(draw(first), draw(replay))
 
-            assert ts >= day_start
-            assert ts < day_end
+    def test_returns_requested_count(self):
+        """Should return one timestamp per requested event."""
+        assert len(seed_splunk.generate_day_timestamps(0, 250)) == 250
 
     def test_hour_distribution_centered_around_14(self):
         """Hours should be centered around 14 (2 PM)."""
-        random.seed(42)
-        hours = []
+        timestamps = seed_splunk.generate_day_timestamps(0, 10000)
+        hours = timestamps // 3600
 
-        for _ in range(1000):
-            hour = random.gauss(14, 4)
-            hour = max(0, min(23, int(hour)))
-            hours.append(hour)
-
-        avg_hour = sum(hours) / len(hours)
         # Average should be close to 14 (within 1 hour)
-        assert 13 <= avg_hour <= 15
+        assert 13 <= hours.mean() <= 15
+        assert hours.min() >= 0
+        assert hours.max() <= 23
 
 
 class TestAnomalyWindows:
@@ -152,19 +167,26 @@ class TestAnomalyWindows:
 
     def test_anomaly_rate_in_window(self):
         """Anomaly rate should be higher during anomaly windows."""
-        anomaly_windows = [(1000.0, 2000.0)]
+        rates = seed_splunk.anomaly_rates(np.array([500.0, 1500.0]), [(1000.0, 2000.0)])
+        assert rates.tolist() == [0.03, 0.30]
+
+    def test_anomaly_rate_window_bounds_inclusive(self):
+        """Timestamps on either window edge should count as inside."""
+        timestamps = np.array([999.0, 1000.0, 2000.0, 2001.0])
+        rates = seed_splunk.anomaly_rates(timestamps, [(1000.0, 2000.0)])
+        assert rates.tolist() == [0.03, 0.30, 0.30, 0.03]
 
-        # Timestamp inside window
-        ts_inside = 1500.0
-        in_anomaly = any(ws <= ts_inside <= we for ws, we in anomaly_windows)
-        anomaly_rate_inside = 0.30 if in_anomaly else 0.03
-        assert anomaly_rate_inside == 0.30
+    def test_anomaly_rate_multiple_windows(self):
+        """Each timestamp should be checked against the window it falls in."""
+        windows = [(5000.0, 6000.0), (1000.0, 2000.0)]
+        timestamps = np.array([1500.0, 3000.0, 5500.0, 7000.0])
+        rates = seed_splunk.anomaly_rates(timestamps, windows)
+        assert rates.tolist() == [0.30, 0.03, 0.30, 0.03]
 
-        # Timestamp outside window
-        ts_outside = 500.0
-        in_anomaly = any(ws <= ts_outside <= we for ws, we in anomaly_windows)
-        anomaly_rate_outside = 0.30 if in_anomaly else 0.03
-        assert anomaly_rate_outside == 0.03
+    def test_anomaly_rate_no_windows(self):
+        """Without windows every timestamp gets the baseline rate."""
+        rates = seed_splunk.anomaly_rates(np.array([1.0, 2.0]), [])
+        assert rates.tolist() == [0.03, 0.03]
 
 
 class TestBatchProcessing:
@@ -221,12 +243,11 @@ class TestSeedFunction:
     """Tests for seed_historical_data function."""
 
     @patch('seed_splunk.hec')
-    @patch('seed_splunk.generate_event')
+    @patch('seed_splunk.generate_batch')
     def test_exits_on_hec_not_ready(self, mock_gen, mock_hec):
         """Should exit when HEC is not ready."""
         mock_hec.wait_until_ready.return_value = False
-
-        import seed_splunk
+        mock_hec.max_connections = 8
 
         with pytest.raises(SystemExit) as exc_info:
             seed_splunk.seed_historical_data()
@@ -234,18 +255,94 @@ class TestSeedFunction:
         assert exc_info.value.code == 1
 
     @patch('seed_splunk.hec')
-    @patch('seed_splunk.generate_event')
-    @patch('seed_splunk.DAYS_TO_SEED', 1)
-    @patch('seed_splunk.EVENTS_PER_DAY', 10)
-    @patch('seed_splunk.BATCH_SIZE', 5)
+    @patch('seed_splunk.generate_batch')
     def test_generates_correct_number_of_events(self, mock_gen, mock_hec):
         """Should generate correct number of events."""
         mock_hec.wait_until_ready.return_value = True
-        mock_hec.send.return_value = True
-        mock_gen.return_value = {"event": "test"}
+        mock_hec.max_connections = 8
+        mock_hec.send_payload.return_value = True
+        mock_gen.side_effect = lambda timestamps, rates: [{"event": "test"}] * len(timestamps)
 
-        import seed_splunk
-        seed_splunk.seed_historical_data()
+        config = seed_splunk.Config(days_to_seed=1, events_per_day=10, batch_size=5,
+                                    send_workers=8, seed_processes=1)
+        seed_splunk.seed_historical_data(config)
 
         # With 10 events and batch size 5, should have 2 full batches
-        assert mock_hec.send.call_count >= 2
+        assert mock_hec.send_payload.call_count >= 2
+
+    @patch('seed_splunk.hec')
+    @patch('seed_splunk.generate_batch')
+    def test_sends_every_batch_with_bounded_workers(self, mock_gen, mock_hec):
+        """Every batch should be sent even when more are queued than workers."""
+        mock_hec.wait_until_ready.return_value = True
+        mock_hec.max_connections = 8
+        mock_hec.send_payload.return_value = True
+        mock_gen.side_effect = lambda timestamps, rates: [{"event": "test"}] * len(timestamps)
+
+        config = seed_splunk.Config(days_to_seed=2, events_per_day=25, batch_size=5,
+                                    send_workers=2, seed_processes=1)
+        seed_splunk.seed_historical_data(config)
+
+        assert mock_hec.send_payload.call_count == 10
+        assert sum(len(c[0][0]) for c in mock_hec.build_payload.call_args_list) == 50
+
+    @patch('seed_splunk.ThreadPoolExecutor')
+    @patch('seed_splunk.hec')
+    @patch('seed_splunk.generate_batch')
+    def test_send_workers_capped_at_connection_pool(self, mock_gen, mock_hec, mock_executor):
+        """Should not run more senders than the HEC client keeps connections for."""
+        mock_hec.wait_until_ready.return_value = True
+        mock_hec.max_connections = 8
+
+        config = seed_splunk.Config(days_to_seed=1, events_per_day=0, batch_size=5,
+                                    send_workers=32, seed_processes=1)
+        seed_splunk.seed_historical_data(config)
+
+        assert mock_executor.call_args[1]['max_workers'] == 8
+
+    def test_day_payloads_cover_every_event(self):
+        """A day should be split into serialized batches covering every event."""
+        payloads = seed_splunk.generate_day_payloads(1_700_000_000, np.random.SeedSequence(42), 23, 10, [])
+
+        assert [count for count, _ in payloads] == [10, 10, 3]
+        assert bytes(payloads[2][1]).count(b"\n") == 3
+
+    def test_iter_day_payloads_bounds_outstanding_days(self):
+        """Should keep at most window days submitted and yield them in order."""
+        submitted = []
+        outstanding = []
+
+        class FakePool:
+            def apply_async(self, fn, args):
+                submitted.append(args[0])
+                outstanding.append(args[0])
+                result = MagicMock()
+                result.get.side_effect = lambda day=args[0]: outstanding.remove(day) or [(1, day)]
+                return result
+
+        days = seed_splunk.iter_day_payloads(FakePool(), [(day,) for day in range(5)], window=2)
+
+        results = []
+        for payloads in days:
+            assert len(outstanding) <= 2
+            results.append(payloads[0][1])
+
+        assert results == [0, 1, 2, 3, 4]
+        assert submitted == [0, 1, 2, 3, 4]
+
+    @patch('seed_splunk.send_batch', side_effect=RuntimeError("boom"))
+    @patch('seed_splunk.Pool')
+    @patch('seed_splunk.hec')
+    def test_pool_terminated_when_sending_fails(self, mock_hec, mock_pool, mock_send):
+        """Worker processes should be shut down if sending raises."""
+        mock_hec.wait_until_ready.return_value = True
+        mock_hec.max_connections = 8
+        mock_pool.return_value.apply_async.side_effect = lambda fn, args: MagicMock(get=lambda: [(1, b"x\n")])
+
+        config = seed_splunk.Config(days_to_seed=3, events_per_day=1, batch_size=1,
+                                    send_workers=1, seed_processes=8)
+        with pytest.raises(RuntimeError):
+            seed_splunk.seed_historical_data(config)
+
+        mock_pool.assert_called_once_with(3)
+        mock_pool.return_value.terminate.assert_called_once()
@@ -1,54 +1,61 @@
-"""Shared Splunk event generation library."""
-
-from .templates import (
-    SERVICES,
-    REPOSITORIES,
-    ENVIRONMENTS,
-    ERROR_TYPES,
-    ENDPOINTS,
-    PAGES,
-    FEATURES,
-    CUSTOMER_TIERS,
-    REGIONS,
-    HOSTS,
-)
-from .generators import (
-    generate_devops_event,
-    generate_sre_event,
-    generate_support_event,
-    generate_business_event,
-    generate_main_event,
-    generate_event,
-    GENERATORS,
-)
-from .hec_client import (
-    send_to_hec,
-    wait_for_splunk,
-    HECClient,
-)
-
-__all__ = [
-    # Templates
-    "SERVICES",
-    "REPOSITORIES",
-    "ENVIRONMENTS",
-    "ERROR_TYPES",
-    "ENDPOINTS",
-    "PAGES",
-    "FEATURES",
-    "CUSTOMER_TIERS",
-    "REGIONS",
-    "HOSTS",
-    # Generators
-    "generate_devops_event",
-    "generate_sre_event",
-    "generate_support_event",
-    "generate_business_event",
-    "generate_main_event",
-    "generate_event",
-    "GENERATORS",
-    # HEC Client
-    "send_to_hec",
-    "wait_for_splunk",
-    "HECClient",
-]
+"""Shared Splunk event generation library.
+
+Submodules are imported on first attribute access (PEP 562), so a caller
+that only needs the HEC client does not pay for building the Faker pools.
+"""
+
+import importlib
+from typing import Any
+
+# Public names by defining submodule; __all__ is derived from this table
+_SUBMODULE_EXPORTS = {
+    ".templates": (
+        "SERVICES",
+        "REPOSITORIES",
+        "ENVIRONMENTS",
+        "ERROR_TYPES",
+        "ENDPOINTS",
+        "PAGES",
+        "FEATURES",
+        "CUSTOMER_TIERS",
+        "REGIONS",
+        "HOSTS",
+    ),
+    ".generators": (
+        "generate_devops_event",
+        "generate_sre_event",
+        "generate_support_event",
+        "generate_business_event",
+        "generate_main_event",
+        "generate_event",
+        "generate_events",
+        "generate_batch",
+        "GENERATORS",
+    ),
+    ".hec_client": (
+        "send_to_hec",
+        "wait_for_splunk",
+        "HECClient",
+    ),
+}
+
+_EXPORTS = {
+    name: module
+    for module, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -0,0 +1,32 @@
+"""Pre-generated filler values for event generation.
+
+Faker is slow per call, so filler values are sampled from pools built
+once at import. IDs that should be unique per event use secrets.token_hex
+instead.
+
+Each pool holds 1 << *_BITS entries so getrandbits(*_BITS) indexes it
+uniformly, which is several times cheaper than random.choice.
+
+The pool Faker is seeded with a fixed value, so every process builds the
+same pools and a seeded run draws the same filler values each time.
+"""
+
+from faker import Faker
+
+# Pool sizes as bit widths; callers index with getrandbits(<POOL>_BITS)
+SENTENCE_BITS = 11
+USERNAME_BITS = 10
+SLUG_BITS = 10
+WORD_BITS = 9
+IP_BITS = 10
+USER_AGENT_BITS = 8
+
+fake = Faker()
+fake.seed_instance(0)
+
+SENTENCES = tuple(fake.sentence() for _ in range(1 << SENTENCE_BITS))
+USERNAMES = tuple(fake.user_name() for _ in range(1 << USERNAME_BITS))
+SLUGS = tuple(fake.slug() for _ in range(1 << SLUG_BITS))
+WORDS = tuple(fake.word() for _ in range(1 << WORD_BITS))
+IPS = tuple(fake.ipv4() for _ in range(1 << IP_BITS))
+USER_AGENTS = tuple(fake.user_agent() for _ in range(1 << USER_AGENT_BITS))
@@ -8,13 +8,14 @@ All generators have a unified signature:
 - anomaly_rate: Probability of anomaly when is_anomaly is None
 """
 
+import bisect
+import itertools
 import random
+import secrets
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
-from faker import Faker
-
 from .templates import (
     SERVICES,
     REPOSITORIES,
@@ -27,8 +28,47 @@ from .templates import (
     REGIONS,
     HOSTS,
 )
+from ._pools import (
+    SENTENCES,
+    SENTENCE_BITS,
+    USERNAMES,
+    USERNAME_BITS,
+    SLUGS,
+    SLUG_BITS,
+    WORDS,
+    WORD_BITS,
+    IPS,
+    IP_BITS,
+    USER_AGENTS,
+    USER_AGENT_BITS,
+)
+
+# Sourcetypes each generator picks from with a single draw per event
+_DEVOPS_SOURCETYPES = ("cicd:pipeline", "container:docker", "container:k8s", "deploy:events", "infra:terraform")
+_SRE_SOURCETYPES = ("app:errors", "metrics:latency", "health:checks", "incident:events", "slo:tracking")
+_SUPPORT_SOURCETYPES = ("session:trace", "ticket:events", "error:user", "feature:usage")
+_BUSINESS_SOURCETYPES = ("kpi:revenue", "kpi:conversion", "compliance:audit", "capacity:metrics", "sla:tracking")
+
+
+def _round1(x: float) -> float:
+    """Round a non-negative metric to one decimal place.
+
+    Half-up rounding with int() is correct for the positive values the
+    generators produce and avoids round()'s slower ndigits path.
+    """
+    return int(x * 10 + 0.5) / 10
+
 
-fake = Faker()
+def _round2(x: float) -> float:
+    """Round a non-negative metric to two decimal places (see _round1)."""
+    return int(x * 100 + 0.5) / 100
+
+
+# Referrer pages, including direct visits with no referrer
+_REFERRERS = (*PAGES, None)
+
+# Weighted log levels for general application logs
+_MAIN_LEVELS = ("DEBUG", "INFO", "INFO", "INFO", "WARN", "ERROR")
 
 
 def _resolve_params(
@@ -44,6 +84,22 @@ def _resolve_params(
     return timestamp, is_anomaly
 
 
+# (start, end, "YYYY-MM-DD") for the most recently formatted local day
+_period_cache: tuple[float, float, str] = (0.0, 0.0, "")
+
+
+def _period(timestamp: float) -> str:
+    """Return the local date string for timestamp, formatting once per day."""
+    global _period_cache
+    start, end, value = _period_cache
+    if start <= timestamp < end:
+        return value
+    day = datetime.fromtimestamp(timestamp).replace(hour=0, minute=0, second=0, microsecond=0)
+    value = day.strftime("%Y-%m-%d")
+    _period_cache = (day.timestamp(), (day + timedelta(days=1)).timestamp(), value)
+    return value
+
+
 def generate_devops_event(
     timestamp: float | None = None,
     is_anomaly: bool | None = None,
@@ -51,41 +107,42 @@ def generate_devops_event(
 ) -> dict[str, Any]:
     """Generate DevOps-related events (CI/CD, containers, deployments)."""
     timestamp, is_anomaly = _resolve_params(timestamp, is_anomaly, anomaly_rate)
-    event_type = random.choice(["cicd:pipeline", "container:docker", "container:k8s", "deploy:events", "infra:terraform"])
+    event_type = random.choice(_DEVOPS_SOURCETYPES)
 
     if event_type == "cicd:pipeline":
-        status = "failure" if is_anomaly else random.choice(["success", "success", "success", "running"])
+        status = "failure" if is_anomaly else random.choice(("success", "success", "success", "running"))
         return {
             "index": "demo_devops",
             "sourcetype": "cicd:pipeline",
             "time": timestamp,
             "event": {
                 "repository": random.choice(REPOSITORIES),
-                "branch": random.choice(["main", "develop", f"feature/{fake.slug()}"]),
-                "pipeline_id": f"pipeline-{fake.uuid4()[:8]}",
-                "stage": random.choice(["build", "test", "deploy", "security-scan"]),
+                "branch": random.choice(("main", "develop", f"feature/{SLUGS[random.getrandbits(SLUG_BITS)]}")),
+                "pipeline_id": f"pipeline-{secrets.token_hex(4)}",
+                "stage": random.choice(("build", "test", "deploy", "security-scan")),
                 "status": status,
                 "duration_ms": random.randint(5000, 300000) if status != "running" else None,
-                "triggered_by": fake.user_name(),
-                "commit_sha": fake.sha1()[:7],
-                "message": fake.sentence() if status == "failure" else None
+                "triggered_by": USERNAMES[random.getrandbits(USERNAME_BITS)],
+                "commit_sha": secrets.token_hex(4)[:7],
+                "message": SENTENCES[random.getrandbits(SENTENCE_BITS)] if status == "failure" else None
             }
         }
 
     elif event_type == "container:docker":
         restart_count = random.randint(5, 20) if is_anomaly else random.randint(0, 2)
+        service = random.choice(SERVICES)
         return {
             "index": "demo_devops",
             "sourcetype": "container:docker",
             "time": timestamp,
             "event": {
-                "container_name": f"{random.choice(SERVICES)}-{random.randint(1,5)}",
-                "container_id": fake.uuid4()[:12],
-                "image": f"company/{random.choice(SERVICES)}:v{random.randint(1,3)}.{random.randint(0,9)}.{random.randint(0,99)}",
-                "status": random.choice(["running", "running", "running", "exited", "restarting"]),
+                "container_name": f"{service}-{random.randint(1,5)}",
+                "container_id": secrets.token_hex(6),
+                "image": f"company/{service}:v{random.randint(1,3)}.{random.randint(0,9)}.{random.randint(0,99)}",
+                "status": random.choice(("running", "running", "running", "exited", "restarting")),
                 "restart_count": restart_count,
-                "cpu_percent": round(random.uniform(5, 95 if is_anomaly else 60), 1),
-                "memory_percent": round(random.uniform(10, 95 if is_anomaly else 70), 1),
+                "cpu_percent": _round1(random.uniform(5, 95 if is_anomaly else 60)),
+                "memory_percent": _round1(random.uniform(10, 95 if is_anomaly else 70)),
                 "host": random.choice(HOSTS)
             }
         }
@@ -96,11 +153,11 @@ def generate_devops_event(
             "sourcetype": "container:k8s",
             "time": timestamp,
             "event": {
-                "namespace": random.choice(["default", "production", "staging", "monitoring"]),
-                "pod_name": f"{random.choice(SERVICES)}-{fake.uuid4()[:8]}",
-                "event_type": random.choice(["Normal", "Normal", "Normal", "Warning"]),
-                "reason": random.choice(["Pulled", "Created", "Started", "Scheduled", "BackOff", "FailedMount"]),
-                "message": fake.sentence(),
+                "namespace": random.choice(("default", "production", "staging", "monitoring")),
+                "pod_name": f"{random.choice(SERVICES)}-{secrets.token_hex(4)}",
+                "event_type": random.choice(("Normal", "Normal", "Normal", "Warning")),
+                "reason": random.choice(("Pulled", "Created", "Started", "Scheduled", "BackOff", "FailedMount")),
+                "message": SENTENCES[random.getrandbits(SENTENCE_BITS)],
                 "node": f"node-{random.randint(1, 5)}"
             }
         }
@@ -114,9 +171,9 @@ def generate_devops_event(
                 "service": random.choice(SERVICES),
                 "environment": random.choice(ENVIRONMENTS),
                 "version": f"v{random.randint(1,3)}.{random.randint(0,9)}.{random.randint(0,99)}",
-                "status": "failed" if is_anomaly else random.choice(["success", "success", "success", "in_progress"]),
-                "deployed_by": fake.user_name(),
-                "deployment_id": f"deploy-{fake.uuid4()[:8]}",
+                "status": "failed" if is_anomaly else random.choice(("success", "success", "success", "in_progress")),
+                "deployed_by": USERNAMES[random.getrandbits(USERNAME_BITS)],
+                "deployment_id": f"deploy-{secrets.token_hex(4)}",
                 "rollback": is_anomaly and random.random() < 0.5,
                 "duration_s": random.randint(30, 600)
             }
@@ -129,15 +186,15 @@ def generate_devops_event(
             "time": timestamp,
             "event": {
                 "workspace": random.choice(ENVIRONMENTS),
-                "action": random.choice(["apply", "plan", "destroy"]),
-                "resource_type": random.choice(["aws_instance", "aws_rds_instance", "aws_s3_bucket", "aws_lambda_function"]),
-                "resource_name": fake.slug(),
+                "action": random.choice(("apply", "plan", "destroy")),
+                "resource_type": random.choice(("aws_instance", "aws_rds_instance", "aws_s3_bucket", "aws_lambda_function")),
+                "resource_name": SLUGS[random.getrandbits(SLUG_BITS)],
                 "changes": {
                     "add": random.randint(0, 5),
                     "change": random.randint(0, 10),
                     "destroy": random.randint(0, 2)
                 },
-                "initiated_by": fake.user_name()
+                "initiated_by": USERNAMES[random.getrandbits(USERNAME_BITS)]
             }
         }
 
@@ -149,7 +206,7 @@ def generate_sre_event(
 ) -> dict[str, Any]:
     """Generate SRE-related events (errors, latency, health checks)."""
     timestamp, is_anomaly = _resolve_params(timestamp, is_anomaly, anomaly_rate)
-    event_type = random.choice(["app:errors", "metrics:latency", "health:checks", "incident:events", "slo:tracking"])
+    event_type = random.choice(_SRE_SOURCETYPES)
 
     if event_type == "app:errors":
         service = random.choice(SERVICES)
@@ -160,11 +217,11 @@ def generate_sre_event(
             "event": {
                 "service": service,
                 "error_type": random.choice(ERROR_TYPES),
-                "severity": "critical" if is_anomaly else random.choice(["warning", "error", "error"]),
-                "message": fake.sentence(),
+                "severity": "critical" if is_anomaly else random.choice(("warning", "error", "error")),
+                "message": SENTENCES[random.getrandbits(SENTENCE_BITS)],
                 "stack_trace": f"at {service}.Handler.process({service}.java:{random.randint(50, 500)})\n  at {service}.Service.execute({service}.java:{random.randint(50, 500)})" if random.random() < 0.3 else None,
-                "trace_id": f"trace-{fake.uuid4()[:16]}",
-                "span_id": f"span-{fake.uuid4()[:8]}",
+                "trace_id": f"trace-{secrets.token_hex(8)}",
+                "span_id": f"span-{secrets.token_hex(4)}",
                 "host": random.choice(HOSTS),
                 "endpoint": random.choice(ENDPOINTS)
             }
@@ -179,11 +236,11 @@ def generate_sre_event(
             "event": {
                 "service": random.choice(SERVICES),
                 "endpoint": random.choice(ENDPOINTS),
-                "method": random.choice(["GET", "GET", "GET", "POST", "PUT", "DELETE"]),
-                "status_code": random.choice([500, 502, 503]) if is_anomaly else random.choice([200, 200, 200, 201, 204, 400, 404]),
+                "method": random.choice(("GET", "GET", "GET", "POST", "PUT", "DELETE")),
+                "status_code": random.choice((500, 502, 503)) if is_anomaly else random.choice((200, 200, 200, 201, 204, 400, 404)),
                 "duration_ms": base_latency * random.randint(5, 20) if is_anomaly else base_latency,
                 "host": random.choice(HOSTS),
-                "trace_id": f"trace-{fake.uuid4()[:16]}"
+                "trace_id": f"trace-{secrets.token_hex(8)}"
             }
         }
 
@@ -194,7 +251,7 @@ def generate_sre_event(
             "time": timestamp,
             "event": {
                 "service": random.choice(SERVICES),
-                "check_type": random.choice(["liveness", "readiness", "startup"]),
+                "check_type": random.choice(("liveness", "readiness", "startup")),
                 "status": "unhealthy" if is_anomaly else "healthy",
                 "response_time_ms": random.randint(100, 5000) if is_anomaly else random.randint(1, 100),
                 "consecutive_failures": random.randint(3, 10) if is_anomaly else 0,
@@ -203,17 +260,18 @@ def generate_sre_event(
         }
 
     elif event_type == "incident:events":
+        service = random.choice(SERVICES)
         return {
             "index": "demo_sre",
             "sourcetype": "incident:events",
             "time": timestamp,
             "event": {
                 "incident_id": f"INC-{random.randint(1000, 9999)}",
-                "severity": random.choice(["P1", "P2", "P3", "P4"]),
-                "status": random.choice(["triggered", "acknowledged", "resolved"]),
-                "title": f"High {random.choice(['error rate', 'latency', 'CPU usage', 'memory usage'])} on {random.choice(SERVICES)}",
-                "service": random.choice(SERVICES),
-                "assigned_to": fake.user_name(),
+                "severity": random.choice(("P1", "P2", "P3", "P4")),
+                "status": random.choice(("triggered", "acknowledged", "resolved")),
+                "title": f"High {random.choice(('error rate', 'latency', 'CPU usage', 'memory usage'))} on {service}",
+                "service": service,
+                "assigned_to": USERNAMES[random.getrandbits(USERNAME_BITS)],
                 "duration_min": random.randint(5, 120)
             }
         }
@@ -226,10 +284,15 @@ def generate_sre_event(
             "time": timestamp,
             "event": {
                 "service": random.choice(SERVICES),
-                "slo_name": random.choice(["availability", "latency_p99", "error_rate"]),
+                "slo_name": random.choice(("availability", "latency_p99", "error_rate")),
                 "target": target,
-                "actual": round(target - random.uniform(1, 5), 2) if is_anomaly else round(target + random.uniform(-0.5, 0.5), 2),
-                "budget_remaining_percent": round(random.uniform(0, 30), 1) if is_anomaly else round(random.uniform(50, 100), 1),
+                "actual": _round2(
+                    target - random.uniform(1, 5) if is_anomaly
+                    else target + random.uniform(-0.5, 0.5)
+                ),
+                "budget_remaining_percent": _round1(
+                    random.uniform(0, 30) if is_anomaly else random.uniform(50, 100)
+                ),
                 "window": "30d"
             }
         }
@@ -242,10 +305,10 @@ def generate_support_event(
 ) -> dict[str, Any]:
     """Generate Support-related events (sessions, tickets, user errors)."""
     timestamp, is_anomaly = _resolve_params(timestamp, is_anomaly, anomaly_rate)
-    event_type = random.choice(["session:trace", "ticket:events", "error:user", "feature:usage"])
+    event_type = random.choice(_SUPPORT_SOURCETYPES)
 
     customer_id = f"cust_{random.randint(100, 999)}"
-    session_id = f"sess_{fake.uuid4()[:12]}"
+    session_id = f"sess_{secrets.token_hex(6)}"
 
     if event_type == "session:trace":
         return {
@@ -257,12 +320,12 @@ def generate_support_event(
                 "user_id": customer_id,
                 "customer_tier": random.choice(CUSTOMER_TIERS),
                 "page": random.choice(PAGES),
-                "action": random.choice(["view", "click", "scroll", "form_submit", "search"]),
-                "element": fake.slug() if random.random() < 0.5 else None,
+                "action": random.choice(("view", "click", "scroll", "form_submit", "search")),
+                "element": SLUGS[random.getrandbits(SLUG_BITS)] if random.random() < 0.5 else None,
                 "duration_ms": random.randint(100, 30000),
-                "referrer": random.choice(PAGES + [None]),
-                "device": random.choice(["desktop", "mobile", "tablet"]),
-                "browser": random.choice(["Chrome", "Firefox", "Safari", "Edge"])
+                "referrer": random.choice(_REFERRERS),
+                "device": random.choice(("desktop", "mobile", "tablet")),
+                "browser": random.choice(("Chrome", "Firefox", "Safari", "Edge"))
             }
         }
 
@@ -275,11 +338,11 @@ def generate_support_event(
                 "ticket_id": f"TKT-{random.randint(10000, 99999)}",
                 "customer_id": customer_id,
                 "customer_tier": random.choice(CUSTOMER_TIERS),
-                "status": random.choice(["new", "open", "pending", "resolved", "closed"]),
-                "priority": random.choice(["low", "medium", "high", "urgent"]),
-                "category": random.choice(["billing", "technical", "account", "feature_request", "bug_report"]),
-                "subject": fake.sentence(),
-                "assigned_to": fake.user_name() if random.random() < 0.7 else None,
+                "status": random.choice(("new", "open", "pending", "resolved", "closed")),
+                "priority": random.choice(("low", "medium", "high", "urgent")),
+                "category": random.choice(("billing", "technical", "account", "feature_request", "bug_report")),
+                "subject": SENTENCES[random.getrandbits(SENTENCE_BITS)],
+                "assigned_to": USERNAMES[random.getrandbits(USERNAME_BITS)] if random.random() < 0.7 else None,
                 "response_time_min": random.randint(5, 480)
             }
         }
@@ -293,14 +356,14 @@ def generate_support_event(
                 "session_id": session_id,
                 "user_id": customer_id,
                 "customer_tier": random.choice(CUSTOMER_TIERS),
-                "error_code": random.choice(["E001", "E002", "E003", "E004", "E005"]),
-                "error_message": random.choice([
+                "error_code": random.choice(("E001", "E002", "E003", "E004", "E005")),
+                "error_message": random.choice((
                     "Payment processing failed",
                     "Session expired",
                     "Invalid input",
                     "Feature not available",
                     "Service temporarily unavailable"
-                ]),
+                )),
                 "page": random.choice(PAGES),
                 "is_blocking": is_anomaly,
                 "retry_count": random.randint(0, 5)
@@ -316,7 +379,7 @@ def generate_support_event(
                 "user_id": customer_id,
                 "customer_tier": random.choice(CUSTOMER_TIERS),
                 "feature": random.choice(FEATURES),
-                "action": random.choice(["enabled", "disabled", "used"]),
+                "action": random.choice(("enabled", "disabled", "used")),
                 "success": random.random() > 0.1,
                 "session_id": session_id
             }
@@ -330,7 +393,7 @@ def generate_business_event(
 ) -> dict[str, Any]:
     """Generate Business/Management events (KPIs, compliance, capacity)."""
     timestamp, is_anomaly = _resolve_params(timestamp, is_anomaly, anomaly_rate)
-    event_type = random.choice(["kpi:revenue", "kpi:conversion", "compliance:audit", "capacity:metrics", "sla:tracking"])
+    event_type = random.choice(_BUSINESS_SOURCETYPES)
 
     if event_type == "kpi:revenue":
         region = random.choice(REGIONS)
@@ -341,8 +404,8 @@ def generate_business_event(
             "time": timestamp,
             "event": {
                 "region": region,
-                "product_line": random.choice(["enterprise", "professional", "starter", "add-ons"]),
-                "period": datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d"),
+                "product_line": random.choice(("enterprise", "professional", "starter", "add-ons")),
+                "period": _period(timestamp),
                 "value": base_value,
                 "target": int(base_value * random.uniform(0.9, 1.1)),
                 "currency": "USD",
@@ -356,11 +419,11 @@ def generate_business_event(
             "sourcetype": "kpi:conversion",
             "time": timestamp,
             "event": {
-                "funnel_stage": random.choice(["visit", "signup", "trial", "purchase", "renewal"]),
-                "source": random.choice(["organic", "paid", "referral", "direct", "social"]),
+                "funnel_stage": random.choice(("visit", "signup", "trial", "purchase", "renewal")),
+                "source": random.choice(("organic", "paid", "referral", "direct", "social")),
                 "count": random.randint(100, 10000),
-                "conversion_rate": round(random.uniform(0.5, 15.0), 2),
-                "period": datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+                "conversion_rate": _round2(random.uniform(0.5, 15.0)),
+                "period": _period(timestamp)
             }
         }
 
@@ -370,13 +433,13 @@ def generate_business_event(
             "sourcetype": "compliance:audit",
             "time": timestamp,
             "event": {
-                "user": fake.user_name(),
-                "action": random.choice(["login", "logout", "config_change", "data_export", "user_create", "permission_change"]),
-                "resource": random.choice(["system_config", "user_data", "reports", "api_keys", "integrations"]),
-                "ip_address": fake.ipv4(),
-                "user_agent": fake.user_agent(),
-                "result": random.choice(["success", "success", "success", "denied", "failed"]),
-                "details": fake.sentence()
+                "user": USERNAMES[random.getrandbits(USERNAME_BITS)],
+                "action": random.choice(("login", "logout", "config_change", "data_export", "user_create", "permission_change")),
+                "resource": random.choice(("system_config", "user_data", "reports", "api_keys", "integrations")),
+                "ip_address": IPS[random.getrandbits(IP_BITS)],
+                "user_agent": USER_AGENTS[random.getrandbits(USER_AGENT_BITS)],
+                "result": random.choice(("success", "success", "success", "denied", "failed")),
+                "details": SENTENCES[random.getrandbits(SENTENCE_BITS)]
             }
         }
 
@@ -388,11 +451,11 @@ def generate_business_event(
             "event": {
                 "host": random.choice(HOSTS),
                 "region": random.choice(REGIONS),
-                "cpu_percent": round(random.uniform(70, 95) if is_anomaly else random.uniform(20, 60), 1),
-                "memory_percent": round(random.uniform(75, 95) if is_anomaly else random.uniform(30, 65), 1),
-                "disk_percent": round(random.uniform(80, 98) if is_anomaly else random.uniform(40, 70), 1),
-                "network_in_mbps": round(random.uniform(50, 200), 1),
-                "network_out_mbps": round(random.uniform(30, 150), 1),
+                "cpu_percent": _round1(random.uniform(70, 95) if is_anomaly else random.uniform(20, 60)),
+                "memory_percent": _round1(random.uniform(75, 95) if is_anomaly else random.uniform(30, 65)),
+                "disk_percent": _round1(random.uniform(80, 98) if is_anomaly else random.uniform(40, 70)),
+                "network_in_mbps": _round1(random.uniform(50, 200)),
+                "network_out_mbps": _round1(random.uniform(30, 150)),
                 "active_connections": random.randint(100, 5000)
             }
         }
@@ -404,12 +467,15 @@ def generate_business_event(
             "time": timestamp,
             "event": {
                 "service": random.choice(SERVICES),
-                "customer_tier": random.choice(["enterprise", "premium"]),
-                "sla_type": random.choice(["uptime", "response_time", "resolution_time"]),
+                "customer_tier": random.choice(("enterprise", "premium")),
+                "sla_type": random.choice(("uptime", "response_time", "resolution_time")),
                 "target": 99.9,
-                "actual": round(99.9 - random.uniform(0.5, 3.0), 2) if is_anomaly else round(random.uniform(99.5, 100.0), 2),
+                "actual": _round2(
+                    99.9 - random.uniform(0.5, 3.0) if is_anomaly
+                    else random.uniform(99.5, 100.0)
+                ),
                 "breached": is_anomaly,
-                "period": datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+                "period": _period(timestamp)
             }
         }
 
@@ -421,20 +487,20 @@ def generate_main_event(
 ) -> dict[str, Any]:
     """Generate general application log events."""
     timestamp, is_anomaly = _resolve_params(timestamp, is_anomaly, anomaly_rate)
-    levels = ["DEBUG", "INFO", "INFO", "INFO", "WARN", "ERROR"]
+    service = random.choice(SERVICES)
 
     return {
         "index": "demo_main",
         "sourcetype": "app:logs",
         "time": timestamp,
         "event": {
-            "level": "ERROR" if is_anomaly else random.choice(levels),
-            "service": random.choice(SERVICES),
-            "message": fake.sentence(),
-            "logger": f"com.company.{random.choice(SERVICES).replace('-', '.')}.{fake.word().capitalize()}",
+            "level": "ERROR" if is_anomaly else random.choice(_MAIN_LEVELS),
+            "service": service,
+            "message": SENTENCES[random.getrandbits(SENTENCE_BITS)],
+            "logger": f"com.company.{service.replace('-', '.')}.{WORDS[random.getrandbits(WORD_BITS)].capitalize()}",
             "thread": f"thread-{random.randint(1, 20)}",
             "host": random.choice(HOSTS),
-            "trace_id": f"trace-{fake.uuid4()[:16]}" if random.random() < 0.3 else None
+            "trace_id": f"trace-{secrets.token_hex(8)}" if random.random() < 0.3 else None
         }
     }
 
@@ -448,6 +514,9 @@ GENERATORS = [
     (generate_main_event, 0.15),
 ]
 
+_GENERATOR_FNS = [generator for generator, _ in GENERATORS]
+_CUM_WEIGHTS = list(itertools.accumulate(weight for _, weight in GENERATORS))
+
 
 def generate_event(
     timestamp: float | None = None,
@@ -455,10 +524,45 @@ def generate_event(
     anomaly_rate: float = 0.05
 ) -> dict[str, Any]:
     """Generate a random event using weighted selection."""
-    r = random.random()
-    cumulative = 0
-    for generator, weight in GENERATORS:
-        cumulative += weight
-        if r < cumulative:
-            return generator(timestamp, is_anomaly, anomaly_rate)
+    i = bisect.bisect_right(_CUM_WEIGHTS, random.random())
+    if i < len(_GENERATOR_FNS):
+        return _GENERATOR_FNS[i](timestamp, is_anomaly, anomaly_rate)
     return generate_main_event(timestamp, is_anomaly, anomaly_rate)
+
+
+def generate_events(
+    count: int,
+    timestamp: float | None = None,
+    anomaly_rate: float = 0.05
+) -> list[dict[str, Any]]:
+    """Generate a batch of random events sharing one timestamp.
+
+    Generators and anomaly flags for the whole batch are each drawn in a
+    single random.choices call rather than once per event.
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    picks = random.choices(_GENERATOR_FNS, cum_weights=_CUM_WEIGHTS, k=count)
+    flags = random.choices((True, False), cum_weights=(anomaly_rate, 1.0), k=count)
+    return [
+        generator(timestamp, is_anomaly, anomaly_rate)
+        for generator, is_anomaly in zip(picks, flags)
+    ]
+
+
+def generate_batch(
+    timestamps: list[float],
+    anomaly_rates: list[float]
+) -> list[dict[str, Any]]:
+    """Generate one event per timestamp, each with its own anomaly rate.
+
+    Generators for the whole batch are drawn in a single random.choices
+    call; anomaly flags are resolved up front against the per-event rates.
+    """
+    _random = random.random
+    picks = random.choices(_GENERATOR_FNS, cum_weights=_CUM_WEIGHTS, k=len(timestamps))
+    flags = [_random() < rate for rate in anomaly_rates]
+    return [
+        generator(timestamp, is_anomaly, rate)
+        for generator, timestamp, is_anomaly, rate in zip(picks, timestamps, flags, anomaly_rates)
+    ]
@@ -1,11 +1,32 @@
 """Splunk HTTP Event Collector (HEC) client."""
 
-import json
+import functools
+import gzip
+import itertools
+import logging
 import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable, Iterator
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Payloads at or below this size are sent uncompressed
+_GZIP_MIN_BYTES = 4096
+
+# send_stream flushes the body to the socket in chunks of roughly this size
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Default keep-alive connections per host, and concurrent send_many requests
+_MAX_CONNECTIONS = 8
 
 
 class HECClient:
@@ -17,7 +38,9 @@ class HECClient:
         token: str | None = None,
         verify_ssl: bool | None = None,
         default_host: str = "splunk-events",
-        timeout: int = 30
+        timeout: int = 30,
+        compress: bool = True,
+        max_connections: int = _MAX_CONNECTIONS
     ):
         self.url = url or os.environ.get("SPLUNK_HEC_URL", "https://splunk:8088")
         self.token = token or os.environ.get("SPLUNK_HEC_TOKEN", "demo-hec-token-12345")
@@ -26,6 +49,61 @@ class HECClient:
         self.verify_ssl = verify_ssl
         self.default_host = default_host
         self.timeout = timeout
+        self.compress = compress
+        # Callers sending from more threads than this lose connections to
+        # urllib3's "Connection pool is full" discards
+        self.max_connections = max_connections
+        self._event_url = f"{self.url}/services/collector/event"
+        self._health_url = f"{self.url}/services/collector/health"
+
+        # Persistent session so batches reuse the same keep-alive TCP/TLS connection
+        self._session = requests.Session()
+        # Transient gateway errors are retried by the adapter; POST must be
+        # opted in since urllib3 only retries idempotent methods by default.
+        # Read errors are not retried: HEC may already have indexed the
+        # batch, so resending it would duplicate events
+        retries = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_connections, max_retries=retries)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Splunk {self.token}",
+            "Content-Type": "application/json"
+        })
+
+        # Streamed bodies are consumed as they are sent, so a retry would
+        # resend an empty body; send_stream uses its own session with none
+        self._stream_session = requests.Session()
+        stream_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+        self._stream_session.mount("https://", stream_adapter)
+        self._stream_session.mount("http://", stream_adapter)
+        self._stream_session.headers.update(self._session.headers)
+
+        # Created on first send_many so clients that never use it hold no executor
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the send_many executor and close pooled connections."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+        self._session.close()
+        self._stream_session.close()
+
+    def __enter__(self) -> "HECClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def send(self, events: list[dict[str, Any]]) -> bool:
         """Send events to Splunk HEC.
@@ -36,57 +114,157 @@ class HECClient:
         Returns:
             True if successful, False otherwise
         """
-        url = f"{self.url}/services/collector/event"
-        headers = {
-            "Authorization": f"Splunk {self.token}",
-            "Content-Type": "application/json"
-        }
+        # Nothing to deliver, so skip the round-trip
+        if not events:
+            return True
+        return self.send_payload(self.build_payload(events))
+
+    def send_many(self, batches: list[list[dict[str, Any]]]) -> list[bool]:
+        """Send several batches to Splunk HEC concurrently.
+
+        Args:
+            batches: Event lists, each sent as one HEC request
+
+        Returns:
+            One result per batch, in input order
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_connections, thread_name_prefix="hec-send")
+            pool = self._pool
+        return list(pool.map(self.send, batches))
+
+    def send_stream(self, events: Iterable[dict[str, Any]]) -> bool:
+        """Send events to Splunk HEC as they are produced.
+
+        The body is streamed with chunked transfer encoding, so the batch is
+        never held in memory at once and posting overlaps generation. Streamed
+        bodies are sent uncompressed and cannot be replayed, so a failed
+        request is reported rather than retried.
+
+        Args:
+            events: Iterable of event dicts with keys: index, sourcetype, time, event
 
-        payload = ""
+        Returns:
+            True if successful, False otherwise
+        """
+        events = iter(events)
+        first = next(events, None)
+        if first is None:
+            return True
+        body = self._stream_body(itertools.chain((first,), events))
+        return self._post(self._stream_session, body, None)
+
+    def _stream_body(self, events: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+        """Yield the NDJSON body for events in chunks of about _STREAM_CHUNK_BYTES."""
+        chunk = bytearray()
+        for event_data in events:
+            chunk += self.build_payload((event_data,))
+            if len(chunk) >= _STREAM_CHUNK_BYTES:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
+
+    def build_payload(self, events: Iterable[dict[str, Any]]) -> bytearray:
+        """Serialize events into a newline-delimited HEC request body.
+
+        Args:
+            events: List of event dicts with keys: index, sourcetype, time, event
+
+        Returns:
+            NDJSON payload ready for send_payload
+        """
+        # One envelope dict is reused for every event; it is serialized
+        # immediately, so overwriting its values between events is safe
+        payload = bytearray()
+        hec_event: dict[str, Any] = {}
+        now = time.time()
+        default_host = self.default_host
+        dumps = orjson.dumps
         for event_data in events:
-            hec_event = {
-                "index": event_data["index"],
-                "sourcetype": event_data["sourcetype"],
-                "time": event_data.get("time", time.time()),
-                "host": event_data["event"].get("host", self.default_host),
-                "event": event_data["event"]
-            }
-            payload += json.dumps(hec_event) + "\n"
+            event = event_data["event"]
+            hec_event["index"] = event_data["index"]
+            hec_event["sourcetype"] = event_data["sourcetype"]
+            hec_event["time"] = event_data.get("time", now)
+            hec_event["host"] = event.get("host", default_host)
+            hec_event["event"] = event
+            payload += dumps(hec_event)
+            payload += b"\n"
+        return payload
 
+    def send_payload(self, payload: bytes | bytearray) -> bool:
+        """Send a pre-serialized NDJSON payload to Splunk HEC.
+
+        Args:
+            payload: Body produced by build_payload
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # HEC accepts gzip bodies; repetitive NDJSON compresses several-fold
+        body: bytes | memoryview = memoryview(payload)
+        headers = None
+        if self.compress and len(payload) > _GZIP_MIN_BYTES:
+            body = gzip.compress(payload, compresslevel=1)
+            headers = {"Content-Encoding": "gzip"}
+        return self._post(self._session, body, headers)
+
+    def _post(
+        self,
+        session: requests.Session,
+        body: bytes | memoryview | Iterator[bytes],
+        headers: dict[str, str] | None
+    ) -> bool:
+        """POST a request body to the event endpoint, reporting failures."""
         try:
-            response = requests.post(
-                url,
+            response = session.post(
+                self._event_url,
+                data=body,
                 headers=headers,
-                data=payload,
                 verify=self.verify_ssl,
                 timeout=self.timeout
             )
             if response.status_code != 200:
-                print(f"HEC error: {response.status_code} - {response.text}")
+                # Raw bytes skip requests' charset detection; HEC errors are short JSON
+                logger.warning(
+                    "HEC error: %d - %s",
+                    response.status_code,
+                    response.content[:200].decode(errors="replace")
+                )
                 return False
             return True
         except requests.exceptions.RequestException as e:
-            print(f"HEC connection error: {e}")
+            logger.warning("HEC connection error: %s", e)
             return False
 
     def wait_until_ready(self, max_retries: int = 120, retry_interval: int = 5) -> bool:
         """Wait for Splunk HEC to be available.
 
+        Polls with exponential backoff starting at 200ms, so a HEC that is
+        already up is detected almost immediately. Each delay is jittered
+        down by up to half so several services started together do not
+        poll in lockstep. Polling continues until max_retries *
+        retry_interval seconds have been spent waiting, the same budget as
+        polling at a fixed retry_interval.
+
         Args:
-            max_retries: Maximum number of retries
-            retry_interval: Seconds between retries
+            max_retries: Retries at the full interval that make up the budget
+            retry_interval: Maximum seconds between retries
 
         Returns:
             True if HEC is ready, False if timeout
         """
         print("Waiting for Splunk HEC to be available...")
+        budget = max_retries * retry_interval
         retries = 0
+        delay = 0.2
+        waited = 0.0
 
-        while retries < max_retries:
+        while True:
             try:
-                response = requests.get(
-                    f"{self.url}/services/collector/health",
-                    headers={"Authorization": f"Splunk {self.token}"},
+                response = self._session.get(
+                    self._health_url,
                     verify=self.verify_ssl,
                     timeout=5
                 )
@@ -95,24 +273,25 @@ class HECClient:
                     return True
             except requests.exceptions.RequestException:
                 pass
+            if waited >= budget:
+                break
             retries += 1
             if retries % 12 == 0:
-                print(f"  Still waiting... ({retries * retry_interval}s)")
-            time.sleep(retry_interval)
+                print(f"  Still waiting... ({waited:.0f}s)")
+            sleep_for = min(delay, retry_interval) * (0.5 + random.random() * 0.5)
+            sleep_for = min(sleep_for, budget - waited)
+            time.sleep(sleep_for)
+            waited += sleep_for
+            delay *= 1.7
 
-        print(f"ERROR: Splunk HEC not available after {max_retries * retry_interval}s")
+        print(f"ERROR: Splunk HEC not available after {waited:.0f}s")
         return False
 
 
 # Module-level convenience functions using default client
-_default_client: HECClient | None = None
-
-
+@functools.cache
 def _get_default_client() -> HECClient:
-    global _default_client
-    if _default_client is None:
-        _default_client = HECClient()
-    return _default_client
+    return HECClient()
 
 
 def send_to_hec(events: list[dict[str, Any]]) -> bool:
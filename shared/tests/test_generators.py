@@ -1,10 +1,15 @@
 """Tests for splunk_events.generators module."""
 
+import re
+import subprocess
+import sys
 import time
+from datetime import datetime
 from unittest.mock import patch
 
 
 from splunk_events.generators import (
+    _period,
     _resolve_params,
     generate_devops_event,
     generate_sre_event,
@@ -12,6 +17,8 @@ from splunk_events.generators import (
     generate_business_event,
     generate_main_event,
     generate_event,
+    generate_events,
+    generate_batch,
     GENERATORS,
 )
 
@@ -57,6 +64,21 @@ class TestResolveParams:
         assert is_anomaly is False
 
 
+class TestPeriod:
+    """Tests for _period date cache."""
+
+    def test_matches_strftime(self):
+        """Should match a direct strftime of the timestamp."""
+        for ts in (1000000.0, 1700000000.0, 1700000000.0 + 86400 * 3.5, 1000000.0):
+            assert _period(ts) == datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+
+    def test_day_boundary(self):
+        """Should roll over at local midnight."""
+        midnight = datetime(2024, 3, 1).timestamp()
+        assert _period(midnight - 1) == "2024-02-29"
+        assert _period(midnight) == "2024-03-01"
+
+
 class TestEventStructure:
     """Tests for required event structure across all generators."""
 
@@ -106,6 +128,9 @@ class TestEventStructure:
 class TestDevopsEvent:
     """Tests for generate_devops_event."""
 
+    VALID_SOURCETYPES = frozenset({'cicd:pipeline', 'container:docker', 'container:k8s',
+                                  'deploy:events', 'infra:terraform'})
+
     def test_index_is_demo_devops(self):
         """Index should be demo_devops."""
         event = generate_devops_event()
@@ -113,10 +138,8 @@ class TestDevopsEvent:
 
     def test_sourcetype_is_valid(self):
         """Sourcetype should be one of the DevOps types."""
-        valid_types = {'cicd:pipeline', 'container:docker', 'container:k8s',
-                       'deploy:events', 'infra:terraform'}
         event = generate_devops_event()
-        assert event['sourcetype'] in valid_types
+        assert event['sourcetype'] in self.VALID_SOURCETYPES
 
     def test_custom_timestamp_used(self):
         """Custom timestamp should be used."""
@@ -126,17 +149,37 @@ class TestDevopsEvent:
 
     def test_cicd_anomaly_has_failure_status(self):
         """CI/CD anomaly should have failure status."""
-        # Generate many events to hit cicd:pipeline
-        for _ in range(50):
+        with patch('splunk_events.generators._DEVOPS_SOURCETYPES', ("cicd:pipeline",)):
             event = generate_devops_event(is_anomaly=True)
-            if event['sourcetype'] == 'cicd:pipeline':
-                assert event['event']['status'] == 'failure'
-                break
+        assert event['event']['status'] == 'failure'
+
+    def test_cicd_ids_are_hex(self):
+        """Pipeline ID and commit SHA should be fixed-length lowercase hex."""
+        with patch('splunk_events.generators._DEVOPS_SOURCETYPES', ("cicd:pipeline",)):
+            event = generate_devops_event()
+        assert re.fullmatch(r"pipeline-[0-9a-f]{8}", event['event']['pipeline_id'])
+        assert re.fullmatch(r"[0-9a-f]{7}", event['event']['commit_sha'])
+
+    def test_docker_image_matches_container_service(self):
+        """Container name and image should refer to the same service."""
+        with patch('splunk_events.generators._DEVOPS_SOURCETYPES', ("container:docker",)):
+            event = generate_devops_event()
+        service = event['event']['container_name'].rsplit('-', 1)[0]
+        assert event['event']['image'].startswith(f"company/{service}:")
+
+    def test_container_id_is_hex(self):
+        """Container ID should be 12 lowercase hex characters."""
+        with patch('splunk_events.generators._DEVOPS_SOURCETYPES', ("container:docker",)):
+            event = generate_devops_event()
+        assert re.fullmatch(r"[0-9a-f]{12}", event['event']['container_id'])
 
 
 class TestSreEvent:
     """Tests for generate_sre_event."""
 
+    VALID_SOURCETYPES = frozenset({'app:errors', 'metrics:latency', 'health:checks',
+                                  'incident:events', 'slo:tracking'})
+
     def test_index_is_demo_sre(self):
         """Index should be demo_sre."""
         event = generate_sre_event()
@@ -144,31 +187,40 @@ class TestSreEvent:
 
     def test_sourcetype_is_valid(self):
         """Sourcetype should be one of the SRE types."""
-        valid_types = {'app:errors', 'metrics:latency', 'health:checks',
-                       'incident:events', 'slo:tracking'}
         event = generate_sre_event()
-        assert event['sourcetype'] in valid_types
+        assert event['sourcetype'] in self.VALID_SOURCETYPES
 
     def test_health_check_anomaly_is_unhealthy(self):
         """Health check anomaly should be unhealthy."""
-        for _ in range(50):
+        with patch('splunk_events.generators._SRE_SOURCETYPES', ("health:checks",)):
             event = generate_sre_event(is_anomaly=True)
-            if event['sourcetype'] == 'health:checks':
-                assert event['event']['status'] == 'unhealthy'
-                break
+        assert event['event']['status'] == 'unhealthy'
 
     def test_metrics_latency_anomaly_has_error_status(self):
         """Metrics latency anomaly should have error status code."""
-        for _ in range(50):
+        with patch('splunk_events.generators._SRE_SOURCETYPES', ("metrics:latency",)):
             event = generate_sre_event(is_anomaly=True)
-            if event['sourcetype'] == 'metrics:latency':
-                assert event['event']['status_code'] in [500, 502, 503]
-                break
+        assert event['event']['status_code'] in [500, 502, 503]
+
+    def test_incident_title_names_its_service(self):
+        """Incident title should mention the incident's service."""
+        with patch('splunk_events.generators._SRE_SOURCETYPES', ("incident:events",)):
+            event = generate_sre_event()
+        assert event['event']['title'].endswith(f" on {event['event']['service']}")
+
+    def test_trace_and_span_ids_are_hex(self):
+        """Trace and span IDs should carry 16 and 8 hex characters."""
+        with patch('splunk_events.generators._SRE_SOURCETYPES', ("app:errors",)):
+            event = generate_sre_event()
+        assert re.fullmatch(r"trace-[0-9a-f]{16}", event['event']['trace_id'])
+        assert re.fullmatch(r"span-[0-9a-f]{8}", event['event']['span_id'])
 
 
 class TestSupportEvent:
     """Tests for generate_support_event."""
 
+    VALID_SOURCETYPES = frozenset({'session:trace', 'ticket:events', 'error:user', 'feature:usage'})
+
     def test_index_is_demo_support(self):
         """Index should be demo_support."""
         event = generate_support_event()
@@ -176,22 +228,22 @@ class TestSupportEvent:
 
     def test_sourcetype_is_valid(self):
         """Sourcetype should be one of the Support types."""
-        valid_types = {'session:trace', 'ticket:events', 'error:user', 'feature:usage'}
         event = generate_support_event()
-        assert event['sourcetype'] in valid_types
+        assert event['sourcetype'] in self.VALID_SOURCETYPES
 
     def test_error_user_anomaly_is_blocking(self):
         """Error user anomaly should be blocking."""
-        for _ in range(50):
+        with patch('splunk_events.generators._SUPPORT_SOURCETYPES', ("error:user",)):
             event = generate_support_event(is_anomaly=True)
-            if event['sourcetype'] == 'error:user':
-                assert event['event']['is_blocking'] is True
-                break
+        assert event['event']['is_blocking'] is True
 
 
 class TestBusinessEvent:
     """Tests for generate_business_event."""
 
+    VALID_SOURCETYPES = frozenset({'kpi:revenue', 'kpi:conversion', 'compliance:audit',
+                                  'capacity:metrics', 'sla:tracking'})
+
     def test_index_is_demo_business(self):
         """Index should be demo_business."""
         event = generate_business_event()
@@ -199,27 +251,30 @@ class TestBusinessEvent:
 
     def test_sourcetype_is_valid(self):
         """Sourcetype should be one of the Business types."""
-        valid_types = {'kpi:revenue', 'kpi:conversion', 'compliance:audit',
-                       'capacity:metrics', 'sla:tracking'}
         event = generate_business_event()
-        assert event['sourcetype'] in valid_types
+        assert event['sourcetype'] in self.VALID_SOURCETYPES
 
     def test_capacity_anomaly_has_high_usage(self):
         """Capacity anomaly should have high CPU/memory usage."""
-        for _ in range(50):
+        with patch('splunk_events.generators._BUSINESS_SOURCETYPES', ("capacity:metrics",)):
             event = generate_business_event(is_anomaly=True)
-            if event['sourcetype'] == 'capacity:metrics':
-                # Anomaly should have high usage (70-95 for CPU)
-                assert event['event']['cpu_percent'] >= 70
-                break
+        # Anomaly should have high usage (70-95 for CPU)
+        assert event['event']['cpu_percent'] >= 70
+
+    def test_capacity_metrics_rounded_to_one_decimal(self):
+        """Capacity metrics should be rounded to one decimal place."""
+        with patch('splunk_events.generators._BUSINESS_SOURCETYPES', ("capacity:metrics",)):
+            event = generate_business_event(is_anomaly=False)
+        for field in ('cpu_percent', 'memory_percent', 'disk_percent',
+                      'network_in_mbps', 'network_out_mbps'):
+            value = event['event'][field]
+            assert value == round(value, 1)
 
     def test_sla_anomaly_is_breached(self):
         """SLA anomaly should be breached."""
-        for _ in range(50):
+        with patch('splunk_events.generators._BUSINESS_SOURCETYPES', ("sla:tracking",)):
             event = generate_business_event(is_anomaly=True)
-            if event['sourcetype'] == 'sla:tracking':
-                assert event['event']['breached'] is True
-                break
+        assert event['event']['breached'] is True
 
 
 class TestMainEvent:
@@ -235,6 +290,12 @@ class TestMainEvent:
         event = generate_main_event()
         assert event['sourcetype'] == 'app:logs'
 
+    def test_logger_matches_service(self):
+        """Logger package should be derived from the event's service."""
+        event = generate_main_event()
+        package = event['event']['service'].replace('-', '.')
+        assert event['event']['logger'].startswith(f"com.company.{package}.")
+
     def test_anomaly_has_error_level(self):
         """Anomaly should have ERROR level."""
         event = generate_main_event(is_anomaly=True)
@@ -269,6 +330,34 @@ class TestGenerateEvent:
         event = generate_main_event(is_anomaly=True)
         assert event['event']['level'] == 'ERROR'
 
+    def test_weighted_selection_boundaries(self):
+        """Draws should map to generators by cumulative weight."""
+        expected = [(0.0, "demo_devops"), (0.2, "demo_sre"), (0.5, "demo_support"),
+                    (0.8, "demo_business"), (0.99, "demo_main")]
+        for r, index in expected:
+            with patch('splunk_events.generators.random.random', return_value=r):
+                event = generate_event(is_anomaly=False)
+            assert event['index'] == index
+
+
+class TestGenerateEvents:
+    """Tests for batched generate_events function."""
+
+    def test_returns_requested_count(self):
+        """Should return the requested number of events."""
+        events = generate_events(25)
+        assert len(events) == 25
+        assert all(isinstance(event, dict) for event in events)
+
+    def test_batch_shares_timestamp(self):
+        """All events in a batch should share the provided timestamp."""
+        events = generate_events(10, timestamp=1000000.0)
+        assert all(event['time'] == 1000000.0 for event in events)
+
+    def test_zero_count_returns_empty(self):
+        """Should return an empty list for a zero-sized batch."""
+        assert generate_events(0) == []
+
 
 class TestGeneratorsDispatchTable:
     """Tests for GENERATORS dispatch table."""
@@ -288,3 +377,65 @@ class TestGeneratorsDispatchTable:
         for generator, _ in GENERATORS:
             result = generator()
             assert isinstance(result, dict)
+
+
+class TestGenerateBatch:
+    """Tests for generate_batch function."""
+
+    def test_uses_per_event_timestamps(self):
+        """Each event should carry its own timestamp."""
+        timestamps = [1000.0, 2000.0, 3000.0]
+        events = generate_batch(timestamps, [0.05] * 3)
+        assert [event['time'] for event in events] == timestamps
+
+    def test_per_event_anomaly_rates(self):
+        """Rates of 0 and 1 should force the anomaly state per event."""
+        with patch('splunk_events.generators.random.choices', return_value=[generate_sre_event] * 2):
+            with patch('splunk_events.generators._SRE_SOURCETYPES', ("app:errors",)):
+                events = generate_batch([1000.0, 2000.0], [1.0, 0.0])
+        assert events[0]['event']['severity'] == "critical"
+        assert events[1]['event']['severity'] != "critical"
+
+    def test_empty_batch(self):
+        """Should return an empty list for no timestamps."""
+        assert generate_batch([], []) == []
+
+
+class TestPools:
+    """Tests for the pre-generated filler value pools."""
+
+    def test_pool_sizes_match_bit_widths(self):
+        """Each pool must hold exactly 1 << bits entries to be indexed with getrandbits(bits)."""
+        from splunk_events import _pools
+        pools = [(_pools.SENTENCES, _pools.SENTENCE_BITS), (_pools.USERNAMES, _pools.USERNAME_BITS),
+                 (_pools.SLUGS, _pools.SLUG_BITS), (_pools.WORDS, _pools.WORD_BITS),
+                 (_pools.IPS, _pools.IP_BITS), (_pools.USER_AGENTS, _pools.USER_AGENT_BITS)]
+        for pool, bits in pools:
+            assert isinstance(pool, tuple)
+            assert len(pool) == 1 << bits
+
+    def test_generators_stay_in_bounds_at_largest_index(self):
+        """Every sourcetype should index its pools within bounds when getrandbits returns its maximum."""
+        from splunk_events import generators
+        persona = [
+            ('_DEVOPS_SOURCETYPES', generate_devops_event),
+            ('_SRE_SOURCETYPES', generate_sre_event),
+            ('_SUPPORT_SOURCETYPES', generate_support_event),
+            ('_BUSINESS_SOURCETYPES', generate_business_event),
+        ]
+        with patch('splunk_events.generators.random.getrandbits', lambda k: (1 << k) - 1):
+            for attr, generator in persona:
+                for sourcetype in getattr(generators, attr):
+                    with patch(f'splunk_events.generators.{attr}', (sourcetype,)):
+                        generator(is_anomaly=False)
+                        generator(is_anomaly=True)
+            generate_main_event()
+
+    def test_pools_identical_across_processes(self):
+        """Pools should not depend on Faker's per-process random state."""
+        code = "from splunk_events._pools import SENTENCES, USERNAMES, IPS; print(SENTENCES[:2], USERNAMES[:2], IPS[:2])"
+        runs = [
+            subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+            for _ in range(2)
+        ]
+        assert runs[0] == runs[1]
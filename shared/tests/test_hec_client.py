@@ -1,12 +1,52 @@
 """Tests for splunk_events.hec_client module."""
 
+import gzip
 import json
+import logging
 import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
 
+import pytest
 import requests
 
-from splunk_events.hec_client import HECClient, send_to_hec, wait_for_splunk
+from splunk_events.hec_client import HECClient, _get_default_client, send_to_hec, wait_for_splunk
+
+
+@contextmanager
+def hec_server(*statuses, stall_first: float = 0):
+    """Run a local HTTP server answering POSTs with the given statuses in turn.
+
+    The first response is held back for stall_first seconds. Yields the
+    base URL and the list of statuses actually served.
+    """
+    served = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            status = statuses[min(len(served), len(statuses) - 1)]
+            served.append(status)
+            if len(served) == 1 and stall_first:
+                time.sleep(stall_first)
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.send_header("Connection", "close")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", served
+    finally:
+        server.shutdown()
+        server.server_close()
 
 
 class TestHECClientInit:
@@ -84,11 +124,35 @@ class TestHECClientInit:
         client = HECClient(timeout=60)
         assert client.timeout == 60
 
+    def test_max_connections_sizes_adapter_pool(self):
+        """Should keep as many connections per host as max_connections."""
+        client = HECClient(url="https://test:8088", max_connections=16)
+        assert client.max_connections == 16
+        assert client._session.get_adapter("https://test:8088")._pool_maxsize == 16
+
+    def test_compress_default_true(self):
+        """Should compress large payloads by default."""
+        assert HECClient().compress is True
+
+    def test_session_preset_headers(self):
+        """Should preset auth and content-type headers on the session."""
+        client = HECClient(token="my-token")
+        assert client._session.headers['Authorization'] == "Splunk my-token"
+        assert client._session.headers['Content-Type'] == "application/json"
+
+    def test_session_retries_gateway_errors(self):
+        """Should retry POSTs on transient gateway errors."""
+        client = HECClient(url="https://test:8088")
+        retries = client._session.get_adapter("https://test:8088").max_retries
+        assert retries.total == 3
+        assert set(retries.status_forcelist) == {502, 503, 504}
+        assert "POST" in retries.allowed_methods
+
 
 class TestHECClientSend:
     """Tests for HECClient.send method."""
 
-    @patch('splunk_events.hec_client.requests.post')
+    @patch('splunk_events.hec_client.requests.Session.post')
     def test_send_success(self, mock_post):
         """Should return True on successful send."""
         mock_response = MagicMock()
@@ -102,7 +166,15 @@ class TestHECClientSend:
         assert result is True
         mock_post.assert_called_once()
 
-    @patch('splunk_events.hec_client.requests.post')
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_empty_returns_true_no_post(self, mock_post):
+        """Should succeed without a request when there are no events."""
+        client = HECClient(url="https://test:8088", token="test-token")
+
+        assert client.send([]) is True
+        mock_post.assert_not_called()
+
+    @patch('splunk_events.hec_client.requests.Session.post')
     def test_send_failure_status(self, mock_post):
         """Should return False on non-200 status."""
         mock_response = MagicMock()
@@ -116,7 +188,22 @@ class TestHECClientSend:
         result = client.send(events)
         assert result is False
 
-    @patch('splunk_events.hec_client.requests.post')
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_failure_logs_truncated_body(self, mock_post, caplog):
+        """Should log the status and at most 200 bytes of the response body."""
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.content = b'{"text":"Invalid data format","code":6}' + b"x" * 500
+        mock_post.return_value = mock_response
+
+        client = HECClient()
+        with caplog.at_level(logging.WARNING, logger="splunk_events.hec_client"):
+            client.send([{"index": "test", "sourcetype": "test", "event": {}}])
+
+        assert 'HEC error: 400 - {"text":"Invalid data format"' in caplog.text
+        assert "x" * 200 not in caplog.text
+
+    @patch('splunk_events.hec_client.requests.Session.post')
     def test_send_request_exception(self, mock_post):
         """Should return False on request exception."""
         mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -127,7 +214,7 @@ class TestHECClientSend:
         result = client.send(events)
         assert result is False
 
-    @patch('splunk_events.hec_client.requests.post')
+    @patch('splunk_events.hec_client.requests.Session.post')
     def test_send_constructs_correct_url(self, mock_post):
         """Should construct correct URL."""
         mock_response = MagicMock()
@@ -140,7 +227,7 @@ class TestHECClientSend:
         call_args = mock_post.call_args
         assert call_args[0][0] == "https://test:8088/services/collector/event"
 
-    @patch('splunk_events.hec_client.requests.post')
+    @patch('splunk_events.hec_client.requests.Session.post')
     def test_send_includes_auth_header(self, mock_post):
         """Should include authorization header."""
         mock_response = MagicMock()
@@ -150,11 +237,9 @@ class TestHECClientSend:
         client = HECClient(url="https://test:8088", token="my-token")
         client.send([{"index": "test", "sourcetype": "test", "event": {}}])
 
-        call_args = mock_post.call_args
-        headers = call_args[1]['headers']
-        assert headers['Authorization'] == "Splunk my-token"
+        assert client._session.headers['Authorization'] == "Splunk my-token"
 
-    @patch('splunk_events.hec_client.requests.post')
+    @patch('splunk_events.hec_client.requests.Session.post')
     def test_send_payload_format(self, mock_post):
         """Should format payload correctly."""
         mock_response = MagicMock()
@@ -169,10 +254,10 @@ class TestHECClientSend:
         client.send(events)
 
         call_args = mock_post.call_args
-        payload = call_args[1]['data']
+        payload = bytes(call_args[1]['data'])
 
-        # Payload should be newline-separated JSON
-        lines = payload.strip().split('\n')
+        # Payload should be newline-separated JSON bytes
+        lines = payload.decode().strip().split('\n')
         assert len(lines) == 2
 
         # Check first event
@@ -186,7 +271,57 @@ class TestHECClientSend:
         event2 = json.loads(lines[1])
         assert event2['host'] == 'custom-host'
 
-    @patch('splunk_events.hec_client.requests.post')
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_small_payload_uncompressed(self, mock_post):
+        """Should not compress small payloads."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        client = HECClient(url="https://test:8088", token="test-token")
+        client.send([{"index": "test", "sourcetype": "test", "event": {}}])
+
+        assert mock_post.call_args[1]['headers'] is None
+
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_large_payload_gzipped(self, mock_post):
+        """Should gzip large payloads and set Content-Encoding."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        client = HECClient(url="https://test:8088", token="test-token")
+        events = [
+            {"index": "test", "sourcetype": "test", "time": 1.0, "event": {"msg": f"message {i}"}}
+            for i in range(200)
+        ]
+        client.send(events)
+
+        call_args = mock_post.call_args
+        assert call_args[1]['headers'] == {"Content-Encoding": "gzip"}
+        lines = gzip.decompress(call_args[1]['data']).decode().strip().split('\n')
+        assert len(lines) == 200
+        assert json.loads(lines[199])['event']['msg'] == "message 199"
+
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_compression_disabled(self, mock_post):
+        """Should send large payloads uncompressed when compress=False."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        client = HECClient(url="https://test:8088", token="test-token", compress=False)
+        events = [
+            {"index": "test", "sourcetype": "test", "time": 1.0, "event": {"msg": f"message {i}"}}
+            for i in range(200)
+        ]
+        client.send(events)
+
+        call_args = mock_post.call_args
+        assert call_args[1]['headers'] is None
+        assert len(bytes(call_args[1]['data']).decode().strip().split('\n')) == 200
+
+    @patch('splunk_events.hec_client.requests.Session.post')
     def test_send_uses_verify_ssl(self, mock_post):
         """Should use verify_ssl setting."""
         mock_response = MagicMock()
@@ -200,11 +335,164 @@ class TestHECClientSend:
         assert call_args[1]['verify'] is True
 
 
+class TestHECClientSendMany:
+    """Tests for HECClient.send_many method."""
+
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_many_posts_each_batch(self, mock_post):
+        """Should post every batch and return results in order."""
+        mock_ok = MagicMock()
+        mock_ok.status_code = 200
+        mock_post.return_value = mock_ok
+
+        client = HECClient(url="https://test:8088")
+        batches = [[{"index": "test", "sourcetype": "test", "event": {"n": i}}] for i in range(5)]
+
+        assert client.send_many(batches) == [True] * 5
+        assert mock_post.call_count == 5
+
+    @patch('splunk_events.hec_client.HECClient.send')
+    def test_send_many_reports_failures(self, mock_send):
+        """Should report a failed batch without affecting the others."""
+        mock_send.side_effect = lambda batch: batch[0]["event"]["ok"]
+
+        client = HECClient()
+        batches = [[{"event": {"ok": True}}], [{"event": {"ok": False}}], [{"event": {"ok": True}}]]
+
+        assert client.send_many(batches) == [True, False, True]
+
+    def test_executor_created_lazily_and_closed(self):
+        """Should only start an executor for send_many and shut it down on close."""
+        with patch.object(HECClient, 'send', return_value=True):
+            with HECClient() as client:
+                assert client._pool is None
+                client.send_many([[{"event": "a"}]])
+                pool = client._pool
+                assert pool is not None
+
+        assert client._pool is None
+        assert pool._shutdown
+
+    def test_send_many_empty(self):
+        """Should return an empty result list for no batches."""
+        assert HECClient().send_many([]) == []
+
+
+class TestHECClientSendStream:
+    """Tests for HECClient.send_stream method."""
+
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_stream_posts_generated_events(self, mock_post):
+        """Should post every event from the iterable as NDJSON."""
+        bodies = []
+        mock_post.side_effect = lambda url, data, **kwargs: (
+            bodies.append(b"".join(data)) or MagicMock(status_code=200)
+        )
+
+        client = HECClient(url="https://test:8088", token="test-token")
+        events = (
+            {"index": "test", "sourcetype": "test", "time": 1.0, "event": {"msg": f"message {i}"}}
+            for i in range(3)
+        )
+
+        assert client.send_stream(events) is True
+        lines = bodies[0].decode().strip().split('\n')
+        assert [json.loads(line)['event']['msg'] for line in lines] == ["message 0", "message 1", "message 2"]
+        assert mock_post.call_args[1]['headers'] is None
+
+    def test_stream_body_is_chunked(self):
+        """Should split large streams into bounded chunks."""
+        client = HECClient()
+        events = (
+            {"index": "test", "sourcetype": "test", "time": 1.0, "event": {"msg": "x" * 1000}}
+            for _ in range(200)
+        )
+
+        chunks = list(client._stream_body(events))
+
+        assert len(chunks) > 1
+        assert b"".join(chunks).count(b"\n") == 200
+
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_stream_failure_status(self, mock_post):
+        """Should return False on non-200 status."""
+        mock_post.return_value = MagicMock(status_code=400, text="No data")
+
+        client = HECClient()
+        assert client.send_stream(iter([{"event": {}}])) is False
+
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_stream_empty_skips_request(self, mock_post):
+        """An empty stream should succeed without opening a request."""
+        client = HECClient()
+        assert client.send_stream(iter([])) is True
+        mock_post.assert_not_called()
+
+
+class TestHECClientRetries:
+    """Tests for adapter retries against a live local server."""
+
+    def test_payload_retried_on_gateway_error(self):
+        """Buffered payloads should be retried after a 503."""
+        with hec_server(503, 200) as (url, served):
+            client = HECClient(url=url)
+            assert client.send([{"index": "test", "sourcetype": "test", "event": {}}]) is True
+        assert served == [503, 200]
+
+    def test_payload_not_retried_after_read_timeout(self):
+        """A POST whose response times out may already be indexed, so it is not resent."""
+        with hec_server(200, stall_first=1.5) as (url, served):
+            client = HECClient(url=url, timeout=1)
+            assert client.send([{"index": "test", "sourcetype": "test", "event": {}}]) is False
+        assert served == [200]
+
+    def test_stream_not_retried_on_gateway_error(self):
+        """Streamed bodies should fail on a 503 instead of resending an empty body."""
+        with hec_server(503, 200) as (url, served):
+            client = HECClient(url=url)
+            events = iter([{"index": "test", "sourcetype": "test", "event": {}}])
+            assert client.send_stream(events) is False
+        assert served == [503]
+
+
+class TestHECClientPayload:
+    """Tests for HECClient.build_payload and send_payload."""
+
+    def test_build_payload_is_ndjson(self):
+        """Should serialize one envelope per line."""
+        client = HECClient(default_host="default-host")
+        payload = client.build_payload([
+            {"index": "idx1", "sourcetype": "st1", "time": 1.0, "event": {"msg": "a"}},
+            {"index": "idx2", "sourcetype": "st2", "time": 2.0, "event": {"msg": "b"}},
+        ])
+
+        lines = bytes(payload).decode().strip().split('\n')
+        assert [json.loads(line)['index'] for line in lines] == ['idx1', 'idx2']
+        assert json.loads(lines[0])['host'] == 'default-host'
+
+    def test_build_payload_empty(self):
+        """Should return an empty body for no events."""
+        assert HECClient().build_payload([]) == b""
+
+    @patch('splunk_events.hec_client.requests.Session.post')
+    def test_send_payload_posts_body(self, mock_post):
+        """Should post a pre-built payload unchanged."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        client = HECClient(url="https://test:8088")
+        payload = b'{"event": {}}\n'
+
+        assert client.send_payload(payload) is True
+        assert bytes(mock_post.call_args[1]['data']) == payload
+
+
 class TestHECClientWaitUntilReady:
     """Tests for HECClient.wait_until_ready method."""
 
     @patch('splunk_events.hec_client.time.sleep')
-    @patch('splunk_events.hec_client.requests.get')
+    @patch('splunk_events.hec_client.requests.Session.get')
     def test_wait_success_immediate(self, mock_get, mock_sleep):
         """Should return True if HEC is ready immediately."""
         mock_response = MagicMock()
@@ -217,8 +505,20 @@ class TestHECClientWaitUntilReady:
         assert result is True
         mock_sleep.assert_not_called()
 
+    @patch('splunk_events.hec_client.requests.Session.get')
+    def test_wait_polls_health_url(self, mock_get):
+        """Should poll the HEC health endpoint."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        client = HECClient(url="https://test:8088")
+        client.wait_until_ready(max_retries=1, retry_interval=1)
+
+        assert mock_get.call_args[0][0] == "https://test:8088/services/collector/health"
+
     @patch('splunk_events.hec_client.time.sleep')
-    @patch('splunk_events.hec_client.requests.get')
+    @patch('splunk_events.hec_client.requests.Session.get')
     def test_wait_success_after_retries(self, mock_get, mock_sleep):
         """Should return True after some retries."""
         mock_fail = MagicMock()
@@ -235,9 +535,9 @@ class TestHECClientWaitUntilReady:
         assert mock_sleep.call_count == 2
 
     @patch('splunk_events.hec_client.time.sleep')
-    @patch('splunk_events.hec_client.requests.get')
+    @patch('splunk_events.hec_client.requests.Session.get')
     def test_wait_timeout(self, mock_get, mock_sleep):
-        """Should return False after max retries."""
+        """Should return False once max_retries * retry_interval seconds are spent."""
         mock_fail = MagicMock()
         mock_fail.status_code = 503
         mock_get.return_value = mock_fail
@@ -246,10 +546,59 @@ class TestHECClientWaitUntilReady:
         result = client.wait_until_ready(max_retries=3, retry_interval=1)
 
         assert result is False
-        assert mock_sleep.call_count == 3
+        assert sum(c[0][0] for c in mock_sleep.call_args_list) == pytest.approx(3)
+        assert mock_get.call_count == mock_sleep.call_count + 1
+
+    @patch('splunk_events.hec_client.random.random', return_value=0.0)
+    @patch('splunk_events.hec_client.time.sleep')
+    @patch('splunk_events.hec_client.requests.Session.get')
+    def test_wait_budget_not_shortened_by_jitter(self, mock_get, mock_sleep, mock_random):
+        """Should wait the full budget even when every delay is jittered to its minimum."""
+        mock_fail = MagicMock()
+        mock_fail.status_code = 503
+        mock_get.return_value = mock_fail
+
+        client = HECClient()
+        client.wait_until_ready(max_retries=120, retry_interval=5)
+
+        assert sum(c[0][0] for c in mock_sleep.call_args_list) == pytest.approx(600)
+
+    @patch('splunk_events.hec_client.random.random', return_value=1.0)
+    @patch('splunk_events.hec_client.time.sleep')
+    @patch('splunk_events.hec_client.requests.Session.get')
+    def test_wait_backs_off_exponentially(self, mock_get, mock_sleep, mock_random):
+        """Should grow the delay between polls, capped at retry_interval."""
+        mock_fail = MagicMock()
+        mock_fail.status_code = 503
+        mock_get.return_value = mock_fail
+
+        client = HECClient()
+        client.wait_until_ready(max_retries=10, retry_interval=1)
+
+        # The final sleep is trimmed to the remaining budget
+        delays = [c[0][0] for c in mock_sleep.call_args_list][:-1]
+        assert delays[0] == 0.2
+        assert delays == sorted(delays)
+        assert max(delays) == 1
+
+    @patch('splunk_events.hec_client.time.sleep')
+    @patch('splunk_events.hec_client.requests.Session.get')
+    def test_wait_jitters_delay(self, mock_get, mock_sleep):
+        """Should sleep between half and all of each backoff step."""
+        mock_fail = MagicMock()
+        mock_fail.status_code = 503
+        mock_get.return_value = mock_fail
+
+        client = HECClient()
+        client.wait_until_ready(max_retries=10, retry_interval=1)
+
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        assert 0.1 <= delays[0] <= 0.2
+        # Skip the final sleep, which is trimmed to the remaining budget
+        assert all(0.5 <= d <= 1 for d in delays[-4:-1])
 
     @patch('splunk_events.hec_client.time.sleep')
-    @patch('splunk_events.hec_client.requests.get')
+    @patch('splunk_events.hec_client.requests.Session.get')
     def test_wait_handles_connection_error(self, mock_get, mock_sleep):
         """Should handle connection errors during wait."""
         mock_get.side_effect = requests.exceptions.ConnectionError()
@@ -283,3 +632,11 @@ class TestModuleLevelFunctions:
 
         assert result is True
         mock_wait.assert_called_once_with(10, 2)
+
+    def test_default_client_is_shared(self):
+        """Default client should be created once and reused."""
+        _get_default_client.cache_clear()
+        try:
+            assert _get_default_client() is _get_default_client()
+        finally:
+            _get_default_client.cache_clear()
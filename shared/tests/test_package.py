@@ -0,0 +1,32 @@
+"""Tests for splunk_events package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import splunk_events
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy attribute access."""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ should resolve to an attribute."""
+        for name in splunk_events.__all__:
+            assert getattr(splunk_events, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should raise AttributeError."""
+        with pytest.raises(AttributeError):
+            splunk_events.does_not_exist
+
+    def test_hec_client_import_skips_generators(self):
+        """Importing HECClient should not load the generators or Faker."""
+        code = (
+            "import sys\n"
+            "from splunk_events import HECClient\n"
+            "assert 'splunk_events.generators' not in sys.modules\n"
+            "assert 'faker' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)